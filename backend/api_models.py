@@ -3,104 +3,114 @@ Pydantic models for API documentation and validation.
 
 These models provide enhanced Swagger documentation and automatic
 validation for FastAPI endpoints.
+
+Note: the routers build plain dictionaries from SQLite rows and do not
+decode or encode request/response bodies through these classes, so they
+are not on the per-request hot path. Keep them as Pydantic models (FastAPI's
+native schema source) and optimize serialization at the response layer.
 """
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
 
-from pydantic import BaseModel, Field
+# Shared config for response-only models: never mutated after construction
+# and tolerant of extra columns coming back from SQLite rows.
+RESPONSE_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
 
 class TestRunBase(BaseModel):
     """Base test run model with common fields"""
 
-    timestamp: str = Field(
+    timestamp: datetime = Field(
         ...,
         description="Test execution timestamp in ISO format",
-        example="2025-06-31T20:00:00",
+        examples=["2025-06-31T20:00:00"],
     )
     drive_model: str = Field(
         ...,
         description="Storage drive model name",
-        example="Samsung SSD 980 PRO",
+        examples=["Samsung SSD 980 PRO"],
         max_length=255,
     )
-    drive_type: str = Field(..., description="Storage technology type", example="NVMe", max_length=100)
+    drive_type: str = Field(..., description="Storage technology type", examples=["NVMe"], max_length=100)
     test_name: str = Field(
         ...,
         description="Human-readable test name",
-        example="random_read_4k",
+        examples=["random_read_4k"],
         max_length=500,
     )
-    block_size: str = Field(..., description="I/O block size", example="4K", max_length=20)
-    read_write_pattern: str = Field(..., description="I/O access pattern", example="randread", max_length=50)
-    queue_depth: int = Field(..., description="I/O queue depth", example=32, ge=1)
-    duration: int = Field(..., description="Test duration in seconds", example=300, ge=1)
-    test_date: Optional[str] = Field(None, description="Test date in ISO format", example="2025-06-31T20:00:00")
-    fio_version: Optional[str] = Field(None, description="FIO version used for testing", example="fio-3.33")
-    job_runtime: Optional[int] = Field(None, description="Job runtime in milliseconds", example=300000)
+    block_size: str = Field(..., description="I/O block size", examples=["4K"], max_length=20)
+    read_write_pattern: str = Field(..., description="I/O access pattern", examples=["randread"], max_length=50)
+    queue_depth: int = Field(..., description="I/O queue depth", examples=[32], ge=1)
+    duration: int = Field(..., description="Test duration in seconds", examples=[300], ge=1)
+    test_date: Optional[datetime] = Field(None, description="Test date in ISO format", examples=["2025-06-31T20:00:00"])
+    fio_version: Optional[str] = Field(None, description="FIO version used for testing", examples=["fio-3.33"])
+    job_runtime: Optional[int] = Field(None, description="Job runtime in milliseconds", examples=[300000])
     rwmixread: Optional[int] = Field(
         None,
         description="Read/write mix percentage for reads",
-        example=70,
+        examples=[70],
         ge=0,
         le=100,
     )
-    total_ios_read: Optional[int] = Field(None, description="Total read I/O operations", example=1500000)
-    total_ios_write: Optional[int] = Field(None, description="Total write I/O operations", example=500000)
-    usr_cpu: Optional[float] = Field(None, description="User CPU utilization percentage", example=15.5, ge=0, le=100)
-    sys_cpu: Optional[float] = Field(None, description="System CPU utilization percentage", example=8.2, ge=0, le=100)
-    hostname: Optional[str] = Field(None, description="Server hostname", example="server-01", max_length=255)
-    protocol: Optional[str] = Field(None, description="Storage access protocol", example="Local", max_length=100)
+    total_ios_read: Optional[int] = Field(None, description="Total read I/O operations", examples=[1500000])
+    total_ios_write: Optional[int] = Field(None, description="Total write I/O operations", examples=[500000])
+    usr_cpu: Optional[float] = Field(None, description="User CPU utilization percentage", examples=[15.5], ge=0, le=100)
+    sys_cpu: Optional[float] = Field(None, description="System CPU utilization percentage", examples=[8.2], ge=0, le=100)
+    hostname: Optional[str] = Field(None, description="Server hostname", examples=["server-01"], max_length=255)
+    protocol: Optional[str] = Field(None, description="Storage access protocol", examples=["Local"], max_length=100)
     description: Optional[str] = Field(
         None,
         description="Test description or notes",
-        example="4K random read performance baseline test",
+        examples=["4K random read performance baseline test"],
         max_length=1000,
     )
     uploaded_file_path: Optional[str] = Field(
         None,
         description="Path to uploaded FIO results file",
-        example="/uploads/server-01/Local/2025-06-31/20-00/results.json",
+        examples=["/uploads/server-01/Local/2025-06-31/20-00/results.json"],
     )
 
     # UUID fields
     config_uuid: Optional[str] = Field(
         None,
         description="Configuration UUID - fixed per host-config (generated from hostname if not provided)",
-        example="550e8400-e29b-41d4-a716-446655440000",
+        examples=["550e8400-e29b-41d4-a716-446655440000"],
     )
     run_uuid: Optional[str] = Field(
         None,
         description="Run UUID - unique per script execution (generated from hostname+date if not provided)",
-        example="6ba7b810-9dad-11d1-80b4-00c04fd430c8",
+        examples=["6ba7b810-9dad-11d1-80b4-00c04fd430c8"],
     )
 
     # Job options
-    output_file: Optional[str] = Field(None, description="FIO output filename", example="testfile")
-    num_jobs: Optional[int] = Field(None, description="Number of concurrent jobs", example=4, ge=1)
+    output_file: Optional[str] = Field(None, description="FIO output filename", examples=["testfile"])
+    num_jobs: Optional[int] = Field(None, description="Number of concurrent jobs", examples=[4], ge=1)
     direct: Optional[int] = Field(
         None,
         description="Direct I/O flag (0=buffered, 1=direct)",
-        example=1,
+        examples=[1],
         ge=0,
         le=1,
     )
-    test_size: Optional[str] = Field(None, description="Test data size", example="10G")
-    sync: Optional[int] = Field(None, description="Sync flag (0=async, 1=sync)", example=0, ge=0, le=1)
-    iodepth: Optional[int] = Field(None, description="I/O depth (same as queue_depth)", example=32, ge=1)
+    test_size: Optional[str] = Field(None, description="Test data size", examples=["10G"])
+    sync: Optional[int] = Field(None, description="Sync flag (0=async, 1=sync)", examples=[0], ge=0, le=1)
+    iodepth: Optional[int] = Field(None, description="I/O depth (same as queue_depth)", examples=[32], ge=1)
 
     # Performance metrics
-    avg_latency: Optional[float] = Field(None, description="Average latency in milliseconds", example=0.256, ge=0)
-    bandwidth: Optional[float] = Field(None, description="Bandwidth in MB/s", example=488.28, ge=0)
-    iops: Optional[float] = Field(None, description="Input/Output Operations Per Second", example=125000.5, ge=0)
-    p70_latency: Optional[float] = Field(None, description="70th percentile latency in milliseconds", example=0.384, ge=0)
-    p90_latency: Optional[float] = Field(None, description="90th percentile latency in milliseconds", example=0.448, ge=0)
-    p95_latency: Optional[float] = Field(None, description="95th percentile latency in milliseconds", example=0.512, ge=0)
-    p99_latency: Optional[float] = Field(None, description="99th percentile latency in milliseconds", example=1.024, ge=0)
+    avg_latency: Optional[float] = Field(None, description="Average latency in milliseconds", examples=[0.256], ge=0)
+    bandwidth: Optional[float] = Field(None, description="Bandwidth in MB/s", examples=[488.28], ge=0)
+    iops: Optional[float] = Field(None, description="Input/Output Operations Per Second", examples=[125000.5], ge=0)
+    p70_latency: Optional[float] = Field(None, description="70th percentile latency in milliseconds", examples=[0.384], ge=0)
+    p90_latency: Optional[float] = Field(None, description="90th percentile latency in milliseconds", examples=[0.448], ge=0)
+    p95_latency: Optional[float] = Field(None, description="95th percentile latency in milliseconds", examples=[0.512], ge=0)
+    p99_latency: Optional[float] = Field(None, description="99th percentile latency in milliseconds", examples=[1.024], ge=0)
     is_latest: int = Field(
         1,
         description="Flag indicating if this is the latest test for this configuration",
-        example=1,
+        examples=[1],
         ge=0,
         le=1,
     )
@@ -109,7 +119,9 @@ class TestRunBase(BaseModel):
 class TestRunResponse(TestRunBase):
     """Test run response model with ID"""
 
-    id: int = Field(..., description="Unique test run identifier", example=1, gt=0)
+    model_config = RESPONSE_MODEL_CONFIG
+
+    id: int = Field(..., description="Unique test run identifier", examples=[1], gt=0)
 
 
 class TestRunUpdate(BaseModel):
@@ -118,22 +130,22 @@ class TestRunUpdate(BaseModel):
     description: Optional[str] = Field(
         None,
         description="Updated test description",
-        example="Updated test description",
+        examples=["Updated test description"],
         max_length=1000,
     )
     test_name: Optional[str] = Field(
         None,
         description="Updated test name",
-        example="Updated test name",
+        examples=["Updated test name"],
         max_length=500,
     )
-    hostname: Optional[str] = Field(None, description="Updated hostname", example="new-server-name", max_length=255)
-    protocol: Optional[str] = Field(None, description="Updated protocol", example="iSCSI", max_length=100)
-    drive_type: Optional[str] = Field(None, description="Updated drive type", example="SATA", max_length=100)
+    hostname: Optional[str] = Field(None, description="Updated hostname", examples=["new-server-name"], max_length=255)
+    protocol: Optional[str] = Field(None, description="Updated protocol", examples=["iSCSI"], max_length=100)
+    drive_type: Optional[str] = Field(None, description="Updated drive type", examples=["SATA"], max_length=100)
     drive_model: Optional[str] = Field(
         None,
         description="Updated drive model",
-        example="WD Black SN850",
+        examples=["WD Black SN850"],
         max_length=255,
     )
 
@@ -141,11 +153,11 @@ class TestRunUpdate(BaseModel):
 class BulkUpdateRequest(BaseModel):
     """Bulk update request model"""
 
-    test_run_ids: List[int] = Field(
+    test_run_ids: list[int] = Field(
         ...,
         description="List of test run IDs to update",
-        example=[1, 2, 3, 15, 42],
-        min_items=1,
+        examples=[[1, 2, 3, 15, 42]],
+        min_length=1,
     )
     updates: TestRunUpdate = Field(..., description="Fields to update with new values")
 
@@ -153,8 +165,10 @@ class BulkUpdateRequest(BaseModel):
 class PerformanceMetric(BaseModel):
     """Performance metric with value and unit"""
 
-    value: Optional[float] = Field(None, description="Metric value", example=125000.5)
-    unit: str = Field(..., description="Metric unit", example="IOPS")
+    model_config = ConfigDict(frozen=True)
+
+    value: Optional[float] = Field(None, description="Metric value", examples=[125000.5])
+    unit: str = Field(..., description="Metric unit", examples=["IOPS"])
 
 
 class PerformanceMetrics(BaseModel):
@@ -172,141 +186,192 @@ class PerformanceMetrics(BaseModel):
 class PerformanceDataResponse(BaseModel):
     """Performance data response with structured metrics"""
 
-    id: int = Field(..., description="Test run ID", example=1)
-    drive_model: str = Field(..., description="Drive model", example="Samsung SSD 980 PRO")
-    drive_type: str = Field(..., description="Drive type", example="NVMe")
-    test_name: str = Field(..., description="Test name", example="random_read_4k")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    id: int = Field(..., description="Test run ID", examples=[1])
+    drive_model: str = Field(..., description="Drive model", examples=["Samsung SSD 980 PRO"])
+    drive_type: str = Field(..., description="Drive type", examples=["NVMe"])
+    test_name: str = Field(..., description="Test name", examples=["random_read_4k"])
     description: Optional[str] = Field(None, description="Test description")
-    block_size: str = Field(..., description="Block size", example="4K")
-    read_write_pattern: str = Field(..., description="I/O pattern", example="randread")
-    timestamp: str = Field(..., description="Test timestamp", example="2025-06-31T20:00:00")
-    queue_depth: int = Field(..., description="Queue depth", example=32)
-    hostname: str = Field(..., description="Hostname", example="server-01")
-    protocol: str = Field(..., description="Protocol", example="Local")
+    block_size: str = Field(..., description="Block size", examples=["4K"])
+    read_write_pattern: str = Field(..., description="I/O pattern", examples=["randread"])
+    timestamp: datetime = Field(..., description="Test timestamp", examples=["2025-06-31T20:00:00"])
+    queue_depth: int = Field(..., description="Queue depth", examples=[32])
+    hostname: str = Field(..., description="Hostname", examples=["server-01"])
+    protocol: str = Field(..., description="Protocol", examples=["Local"])
     output_file: Optional[str] = Field(None, description="Output file")
     num_jobs: Optional[int] = Field(None, description="Number of jobs")
     direct: Optional[int] = Field(None, description="Direct I/O flag")
     test_size: Optional[str] = Field(None, description="Test size")
     sync: Optional[int] = Field(None, description="Sync flag")
     iodepth: Optional[int] = Field(None, description="I/O depth")
-    duration: int = Field(..., description="Duration in seconds", example=300)
+    duration: int = Field(..., description="Duration in seconds", examples=[300])
     metrics: PerformanceMetrics = Field(..., description="Performance metrics")
 
 
 class ServerInfo(BaseModel):
     """Server information with test statistics"""
 
-    hostname: str = Field(..., description="Server hostname", example="server-01")
-    config_count: int = Field(..., description="Number of unique test configurations", example=15, ge=0)
-    total_runs: int = Field(..., description="Total number of test executions", example=342, ge=0)
-    last_test_time: str = Field(..., description="Most recent test timestamp", example="2025-06-31T20:00:00")
-    first_test_time: str = Field(..., description="Oldest test timestamp", example="2024-01-15T10:30:00")
+    hostname: str = Field(..., description="Server hostname", examples=["server-01"])
+    config_count: int = Field(..., description="Number of unique test configurations", examples=[15], ge=0)
+    total_runs: int = Field(..., description="Total number of test executions", examples=[342], ge=0)
+    last_test_time: str = Field(..., description="Most recent test timestamp", examples=["2025-06-31T20:00:00"])
+    first_test_time: str = Field(..., description="Oldest test timestamp", examples=["2024-01-15T10:30:00"])
 
 
 class TrendDataPoint(BaseModel):
     """Single trend data point"""
 
-    timestamp: str = Field(..., description="Data point timestamp", example="2025-06-31T20:00:00")
-    block_size: str = Field(..., description="Block size for this data point", example="4K")
-    read_write_pattern: str = Field(..., description="I/O pattern for this data point", example="randread")
-    queue_depth: int = Field(..., description="Queue depth for this data point", example=32)
-    value: float = Field(..., description="Metric value", example=125000.5)
-    unit: str = Field(..., description="Metric unit", example="IOPS")
-    moving_avg: Optional[float] = Field(None, description="3-point moving average", example=123500.0)
-    percent_change: Optional[str] = Field(None, description="Percentage change from previous value", example="+2.5%")
+    timestamp: datetime = Field(..., description="Data point timestamp", examples=["2025-06-31T20:00:00"])
+    block_size: str = Field(..., description="Block size for this data point", examples=["4K"])
+    read_write_pattern: str = Field(..., description="I/O pattern for this data point", examples=["randread"])
+    queue_depth: int = Field(..., description="Queue depth for this data point", examples=[32])
+    value: float = Field(..., description="Metric value", examples=[125000.5])
+    unit: str = Field(..., description="Metric unit", examples=["IOPS"])
+    moving_avg: Optional[float] = Field(None, description="3-point moving average", examples=[123500.0])
+    percent_change: Optional[str] = Field(None, description="Percentage change from previous value", examples=["+2.5%"])
 
 
 class TrendAnalysis(BaseModel):
     """Statistical trend analysis"""
 
-    total_points: int = Field(..., description="Total number of data points analyzed", example=30, ge=0)
-    min_value: float = Field(..., description="Minimum value in the dataset", example=115000.0)
-    max_value: float = Field(..., description="Maximum value in the dataset", example=125000.0)
-    avg_value: float = Field(..., description="Average value across all data points", example=120500.0)
-    first_value: float = Field(..., description="First chronological value", example=118000.0)
-    last_value: float = Field(..., description="Last chronological value", example=122000.0)
-    overall_change: str = Field(..., description="Overall percentage change from first to last", example="+3.4%")
+    total_points: int = Field(..., description="Total number of data points analyzed", examples=[30], ge=0)
+    min_value: float = Field(..., description="Minimum value in the dataset", examples=[115000.0])
+    max_value: float = Field(..., description="Maximum value in the dataset", examples=[125000.0])
+    avg_value: float = Field(..., description="Average value across all data points", examples=[120500.0])
+    first_value: float = Field(..., description="First chronological value", examples=[118000.0])
+    last_value: float = Field(..., description="Last chronological value", examples=[122000.0])
+    overall_change: str = Field(..., description="Overall percentage change from first to last", examples=["+3.4%"])
 
 
 class TrendResponse(BaseModel):
     """Trend analysis response"""
 
-    data: List[TrendDataPoint] = Field(..., description="Chronological trend data points")
+    data: list[TrendDataPoint] = Field(..., description="Chronological trend data points")
     trend_analysis: TrendAnalysis = Field(..., description="Statistical analysis of the trend")
 
 
 class TimeSeriesDataPoint(BaseModel):
     """Time series data point for visualization"""
 
-    timestamp: str = Field(..., description="Data timestamp", example="2025-06-31T20:00:00")
-    hostname: str = Field(..., description="Server hostname", example="server-01")
-    protocol: str = Field(..., description="Storage protocol", example="Local")
-    drive_model: str = Field(..., description="Drive model", example="Samsung SSD 980 PRO")
-    drive_type: str = Field(..., description="Drive type", example="NVMe")
-    block_size: str = Field(..., description="Block size", example="4K")
-    read_write_pattern: str = Field(..., description="I/O pattern", example="randread")
-    queue_depth: int = Field(..., description="Queue depth", example=32)
-    metric_type: str = Field(..., description="Metric type", example="iops")
-    value: float = Field(..., description="Metric value", example=125000.5)
-    unit: str = Field(..., description="Metric unit", example="IOPS")
+    timestamp: datetime = Field(..., description="Data timestamp", examples=["2025-06-31T20:00:00"])
+    hostname: str = Field(..., description="Server hostname", examples=["server-01"])
+    protocol: str = Field(..., description="Storage protocol", examples=["Local"])
+    drive_model: str = Field(..., description="Drive model", examples=["Samsung SSD 980 PRO"])
+    drive_type: str = Field(..., description="Drive type", examples=["NVMe"])
+    block_size: str = Field(..., description="Block size", examples=["4K"])
+    read_write_pattern: str = Field(..., description="I/O pattern", examples=["randread"])
+    queue_depth: int = Field(..., description="Queue depth", examples=[32])
+    metric_type: str = Field(..., description="Metric type", examples=["iops"])
+    value: float = Field(..., description="Metric value", examples=[125000.5])
+    unit: str = Field(..., description="Metric unit", examples=["IOPS"])
 
 
 class HistoricalDataPoint(BaseModel):
     """Historical time series data point"""
 
-    test_run_id: int = Field(..., description="Test run ID", example=1)
-    timestamp: str = Field(..., description="Test timestamp", example="2025-06-31T20:00:00")
-    hostname: str = Field(..., description="Server hostname", example="server-01")
-    protocol: str = Field(..., description="Storage protocol", example="Local")
-    drive_model: str = Field(..., description="Drive model", example="Samsung SSD 980 PRO")
-    block_size: str = Field(..., description="Block size", example="4K")
-    read_write_pattern: str = Field(..., description="I/O pattern", example="randread")
-    queue_depth: int = Field(..., description="Queue depth", example=32)
-    iops: Optional[float] = Field(None, description="IOPS value", example=125000.5)
-    avg_latency: Optional[float] = Field(None, description="Average latency in ms", example=0.256)
-    bandwidth: Optional[float] = Field(None, description="Bandwidth in MB/s", example=488.28)
-    p70_latency: Optional[float] = Field(None, description="P70 latency in ms", example=0.384)
-    p90_latency: Optional[float] = Field(None, description="P90 latency in ms", example=0.448)
-    p95_latency: Optional[float] = Field(None, description="P95 latency in ms", example=0.512)
-    p99_latency: Optional[float] = Field(None, description="P99 latency in ms", example=1.024)
+    model_config = RESPONSE_MODEL_CONFIG
+
+    test_run_id: int = Field(..., description="Test run ID", examples=[1])
+    timestamp: datetime = Field(..., description="Test timestamp", examples=["2025-06-31T20:00:00"])
+    hostname: str = Field(..., description="Server hostname", examples=["server-01"])
+    protocol: str = Field(..., description="Storage protocol", examples=["Local"])
+    drive_model: str = Field(..., description="Drive model", examples=["Samsung SSD 980 PRO"])
+    block_size: str = Field(..., description="Block size", examples=["4K"])
+    read_write_pattern: str = Field(..., description="I/O pattern", examples=["randread"])
+    queue_depth: int = Field(..., description="Queue depth", examples=[32])
+    iops: Optional[float] = Field(None, description="IOPS value", examples=[125000.5])
+    avg_latency: Optional[float] = Field(None, description="Average latency in ms", examples=[0.256])
+    bandwidth: Optional[float] = Field(None, description="Bandwidth in MB/s", examples=[488.28])
+    p70_latency: Optional[float] = Field(None, description="P70 latency in ms", examples=[0.384])
+    p90_latency: Optional[float] = Field(None, description="P90 latency in ms", examples=[0.448])
+    p95_latency: Optional[float] = Field(None, description="P95 latency in ms", examples=[0.512])
+    p99_latency: Optional[float] = Field(None, description="P99 latency in ms", examples=[1.024])
+    config_uuid: Optional[str] = Field(None, description="Configuration UUID")
+    run_uuid: Optional[str] = Field(None, description="Run UUID")
+
+
+class HistoricalDataFrame(BaseModel):
+    """Columnar (one list per field) form of a page of historical data points"""
+
+    model_config = RESPONSE_MODEL_CONFIG
+
+    test_run_id: list[int] = Field(..., description="Test run IDs", examples=[[1, 2]])
+    timestamp: list[datetime] = Field(..., description="Test timestamps", examples=[["2025-06-31T20:00:00", "2025-06-30T20:00:00"]])
+    hostname: list[Optional[str]] = Field(..., description="Server hostnames", examples=[["server-01", "server-01"]])
+    protocol: list[Optional[str]] = Field(..., description="Storage protocols", examples=[["Local", "Local"]])
+    drive_model: list[Optional[str]] = Field(..., description="Drive models", examples=[["Samsung SSD 980 PRO", "Samsung SSD 980 PRO"]])
+    block_size: list[Optional[str]] = Field(..., description="Block sizes", examples=[["4K", "4K"]])
+    read_write_pattern: list[Optional[str]] = Field(..., description="I/O patterns", examples=[["randread", "randread"]])
+    queue_depth: list[Optional[int]] = Field(..., description="Queue depths", examples=[[32, 32]])
+    avg_latency: list[Optional[float]] = Field(..., description="Average latencies", examples=[[0.256, 0.261]])
+    bandwidth: list[Optional[float]] = Field(..., description="Bandwidth values", examples=[[488.28, 480.1]])
+    iops: list[Optional[float]] = Field(..., description="IOPS values", examples=[[125000.5, 123000.0]])
+    p70_latency: list[Optional[float]] = Field(..., description="70th percentile latencies", examples=[[0.384, 0.39]])
+    p90_latency: list[Optional[float]] = Field(..., description="90th percentile latencies", examples=[[0.448, 0.45]])
+    p95_latency: list[Optional[float]] = Field(..., description="95th percentile latencies", examples=[[0.512, 0.52]])
+    p99_latency: list[Optional[float]] = Field(..., description="99th percentile latencies", examples=[[1.024, 1.1]])
+    config_uuid: list[Optional[str]] = Field(..., description="Configuration UUIDs")
+    run_uuid: list[Optional[str]] = Field(..., description="Run UUIDs")
+
+
+class HistoricalPagination(BaseModel):
+    """Pagination details of a page of historical data"""
+
+    model_config = RESPONSE_MODEL_CONFIG
+
+    total_count: int = Field(..., description="Records matching the filters", examples=[1250], ge=0)
+    limit: int = Field(..., description="Page size", examples=[10000], ge=1)
+    offset: int = Field(..., description="Records skipped", examples=[0], ge=0)
+    returned_count: int = Field(..., description="Records in this page", examples=[1250], ge=0)
+    has_more: bool = Field(..., description="Whether another page follows", examples=[False])
+
+
+class HistoricalDataResponse(BaseModel):
+    """Page of historical data in row (format=rows) or columnar (format=columns) layout"""
+
+    model_config = RESPONSE_MODEL_CONFIG
+
+    data: list[HistoricalDataPoint] | HistoricalDataFrame = Field(..., description="Historical data points")
+    pagination: HistoricalPagination = Field(..., description="Pagination details")
 
 
 class FilterOptions(BaseModel):
     """Available filter options"""
 
-    drive_models: List[str] = Field(
+    drive_models: tuple[str, ...] = Field(
         ...,
         description="Available drive models",
-        example=["Samsung SSD 980 PRO", "WD Black SN850"],
+        examples=[["Samsung SSD 980 PRO", "WD Black SN850"]],
     )
-    host_disk_combinations: List[str] = Field(
+    host_disk_combinations: tuple[str, ...] = Field(
         ...,
         description="Formatted hostname-protocol-drive combinations",
-        example=["server-01 - Local - Samsung SSD 980 PRO"],
+        examples=[["server-01 - Local - Samsung SSD 980 PRO"]],
     )
-    block_sizes: List[str] = Field(..., description="Available block sizes", example=["4K", "8K", "64K", "1M"])
-    patterns: List[str] = Field(
+    block_sizes: tuple[str, ...] = Field(..., description="Available block sizes", examples=[["4K", "8K", "64K", "1M"]])
+    patterns: tuple[str, ...] = Field(
         ...,
         description="Available I/O patterns",
-        example=["randread", "randwrite", "read", "write"],
+        examples=[["randread", "randwrite", "read", "write"]],
     )
-    syncs: List[int] = Field(..., description="Available sync flag values", example=[0, 1])
-    queue_depths: List[int] = Field(..., description="Available queue depths", example=[1, 8, 16, 32, 64])
-    directs: List[int] = Field(..., description="Available direct I/O flag values", example=[0, 1])
-    num_jobs: List[int] = Field(..., description="Available job count values", example=[1, 4, 8, 16])
-    test_sizes: List[str] = Field(..., description="Available test sizes", example=["1G", "10G", "100G"])
-    durations: List[int] = Field(
+    syncs: tuple[int, ...] = Field(..., description="Available sync flag values", examples=[[0, 1]])
+    queue_depths: tuple[int, ...] = Field(..., description="Available queue depths", examples=[[1, 8, 16, 32, 64]])
+    directs: tuple[int, ...] = Field(..., description="Available direct I/O flag values", examples=[[0, 1]])
+    num_jobs: tuple[int, ...] = Field(..., description="Available job count values", examples=[[1, 4, 8, 16]])
+    test_sizes: tuple[str, ...] = Field(..., description="Available test sizes", examples=[["1G", "10G", "100G"]])
+    durations: tuple[int, ...] = Field(
         ...,
         description="Available test durations in seconds",
-        example=[30, 60, 300, 600],
+        examples=[[30, 60, 300, 600]],
     )
-    hostnames: List[str] = Field(
+    hostnames: tuple[str, ...] = Field(
         ...,
         description="Available hostnames",
-        example=["server-01", "server-02", "server-03"],
+        examples=[["server-01", "server-02", "server-03"]],
     )
-    protocols: List[str] = Field(..., description="Available protocols", example=["Local", "iSCSI", "NFS"])
-    drive_types: List[str] = Field(..., description="Available drive types", example=["NVMe", "SATA", "SAS"])
+    protocols: tuple[str, ...] = Field(..., description="Available protocols", examples=[["Local", "iSCSI", "NFS"]])
+    drive_types: tuple[str, ...] = Field(..., description="Available drive types", examples=[["NVMe", "SATA", "SAS"]])
 
 
 class ImportResponse(BaseModel):
@@ -315,24 +380,54 @@ class ImportResponse(BaseModel):
     message: str = Field(
         ...,
         description="Import operation result message",
-        example="FIO data imported successfully",
+        examples=["FIO data imported successfully"],
     )
-    test_run_id: int = Field(..., description="ID of the newly created test run", example=42)
+    test_run_id: int = Field(..., description="ID of the newly created test run", examples=[42])
     filename: str = Field(
         ...,
         description="Name of the imported file",
-        example="fio_results_2025-06-31.json",
+        examples=["fio_results_2025-06-31.json"],
     )
 
 
 class BulkImportStatistics(BaseModel):
     """Bulk import operation statistics"""
 
-    totalFiles: int = Field(..., description="Total number of files found", example=30, ge=0)
-    processedFiles: int = Field(..., description="Number of files successfully processed", example=25, ge=0)
-    totalTestRuns: int = Field(..., description="Number of test runs imported", example=25, ge=0)
-    skippedFiles: int = Field(..., description="Number of files skipped (duplicates)", example=3, ge=0)
-    errorFiles: int = Field(..., description="Number of files with errors", example=2, ge=0)
+    totalFiles: int = Field(..., description="Total number of files found", examples=[30], ge=0)
+    processedFiles: int = Field(..., description="Number of files successfully processed", examples=[25], ge=0)
+    totalTestRuns: int = Field(..., description="Number of test runs imported", examples=[25], ge=0)
+    skippedFiles: int = Field(..., description="Number of files skipped (duplicates)", examples=[3], ge=0)
+    errorFiles: int = Field(..., description="Number of files with errors", examples=[2], ge=0)
+
+
+class BulkImportFileMetadata(BaseModel):
+    """Test run record extracted from one file during a bulk import dry run"""
+
+    # The record also carries the remaining metrics and any extra keys from the
+    # .info file, so unknown keys are kept rather than rejected
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+    hostname: Optional[str] = Field(None, description="Server hostname", examples=["server-01"])
+    protocol: Optional[str] = Field(None, description="Storage protocol", examples=["Local"])
+    drive_type: Optional[str] = Field(None, description="Drive type", examples=["NVMe"])
+    drive_model: Optional[str] = Field(None, description="Drive model", examples=["Samsung SSD 980 PRO"])
+    test_name: Optional[str] = Field(None, description="Test name", examples=["randread_4k"])
+    description: Optional[str] = Field(None, description="Test description", examples=["Imported from test.json"])
+    block_size: Optional[str] = Field(None, description="Block size", examples=["4K"])
+    read_write_pattern: Optional[str] = Field(None, description="I/O pattern", examples=["randread"])
+    queue_depth: Optional[int] = Field(None, description="Queue depth", examples=[32])
+    num_jobs: Optional[int] = Field(None, description="Number of concurrent jobs", examples=[4])
+    direct: Optional[int] = Field(None, description="Direct I/O flag", examples=[1])
+    sync: Optional[int] = Field(None, description="Sync flag", examples=[0])
+    test_size: Optional[str] = Field(None, description="Test data size", examples=["10G"])
+    duration: Optional[int] = Field(None, description="Test duration in seconds", examples=[300])
+    timestamp: Optional[str] = Field(None, description="Test timestamp", examples=["2025-06-31T20:00:00"])
+    test_date: Optional[str] = Field(None, description="Test date", examples=["2025-06-31T20:00:00"])
+    config_uuid: Optional[str] = Field(None, description="Configuration UUID", examples=["550e8400-e29b-41d4-a716-446655440000"])
+    run_uuid: Optional[str] = Field(None, description="Run UUID", examples=["6ba7b810-9dad-11d1-80b4-00c04fd430c8"])
+    iops: Optional[float] = Field(None, description="IOPS value", examples=[125000.5])
+    avg_latency: Optional[float] = Field(None, description="Average latency in milliseconds", examples=[0.256])
+    bandwidth: Optional[float] = Field(None, description="Bandwidth in MB/s", examples=[488.28])
 
 
 class BulkImportDryRunResult(BaseModel):
@@ -341,17 +436,9 @@ class BulkImportDryRunResult(BaseModel):
     path: str = Field(
         ...,
         description="File path",
-        example="/uploads/server-01/Local/2025-06-31/20-00/test.json",
-    )
-    metadata: Dict[str, Any] = Field(
-        ...,
-        description="Extracted metadata",
-        example={
-            "hostname": "server-01",
-            "protocol": "Local",
-            "test_name": "randread_4k",
-        },
+        examples=["/uploads/server-01/Local/2025-06-31/20-00/test.json"],
     )
+    metadata: BulkImportFileMetadata = Field(..., description="Extracted metadata")
 
 
 class BulkImportResponse(BaseModel):
@@ -360,10 +447,10 @@ class BulkImportResponse(BaseModel):
     message: str = Field(
         ...,
         description="Bulk import result message",
-        example="Bulk import completed: 25 files processed, 25 test runs imported",
+        examples=["Bulk import completed: 25 files processed, 25 test runs imported"],
     )
     statistics: BulkImportStatistics = Field(..., description="Import operation statistics")
-    dryRunResults: Optional[List[BulkImportDryRunResult]] = Field(None, description="Dry run results (only present when dryRun=true)")
+    dryRunResults: Optional[list[BulkImportDryRunResult]] = Field(None, description="Dry run results (only present when dryRun=true)")
 
 
 class BulkUpdateResponse(BaseModel):
@@ -372,66 +459,66 @@ class BulkUpdateResponse(BaseModel):
     message: str = Field(
         ...,
         description="Update operation result message",
-        example="Successfully updated 5 test runs",
+        examples=["Successfully updated 5 test runs"],
     )
-    updated: int = Field(..., description="Number of successfully updated records", example=5, ge=0)
-    failed: int = Field(..., description="Number of records that failed to update", example=0, ge=0)
+    updated: int = Field(..., description="Number of successfully updated records", examples=[5], ge=0)
+    failed: int = Field(..., description="Number of records that failed to update", examples=[0], ge=0)
 
 
 class BulkDeleteResponse(BaseModel):
     """Bulk delete operation response"""
 
-    deleted: int = Field(..., description="Number of successfully deleted records", example=8, ge=0)
-    notFound: int = Field(..., description="Number of records that were not found", example=2, ge=0)
+    deleted: int = Field(..., description="Number of successfully deleted records", examples=[8], ge=0)
+    notFound: int = Field(..., description="Number of records that were not found", examples=[2], ge=0)
 
 
 class APIInfo(BaseModel):
     """API information response"""
 
-    name: str = Field(..., description="API name", example="FIO Analyzer API")
-    version: str = Field(..., description="API version", example="1.0.0")
+    name: str = Field(..., description="API name", examples=["FIO Analyzer API"])
+    version: str = Field(..., description="API version", examples=["1.0.0"])
     description: str = Field(
         ...,
         description="API description",
-        example="API for FIO (Flexible I/O Tester) performance analysis and time-series monitoring",
+        examples=["API for FIO (Flexible I/O Tester) performance analysis and time-series monitoring"],
     )
-    endpoints: int = Field(..., description="Number of available endpoints", example=20, ge=0)
-    documentation: str = Field(..., description="Primary documentation URL", example="/docs")
-    redoc_documentation: str = Field(..., description="ReDoc documentation URL", example="/redoc")
-    openapi_schema: str = Field(..., description="OpenAPI schema URL", example="/openapi.json")
-    features: List[str] = Field(
+    endpoints: int = Field(..., description="Number of available endpoints", examples=[20], ge=0)
+    documentation: str = Field(..., description="Primary documentation URL", examples=["/docs"])
+    redoc_documentation: str = Field(..., description="ReDoc documentation URL", examples=["/redoc"])
+    openapi_schema: str = Field(..., description="OpenAPI schema URL", examples=["/openapi.json"])
+    features: list[str] = Field(
         ...,
         description="List of API features",
-        example=[
+        examples=[[
             "FIO benchmark data import",
             "Performance metrics analysis",
             "Historical time series data",
-        ],
+        ]],
     )
-    supported_formats: List[str] = Field(..., description="Supported data formats", example=["JSON"])
-    authentication: str = Field(..., description="Authentication method", example="HTTP Basic Auth")
+    supported_formats: list[str] = Field(..., description="Supported data formats", examples=[["JSON"]])
+    authentication: str = Field(..., description="Authentication method", examples=["HTTP Basic Auth"])
 
 
 class SuccessResponse(BaseModel):
     """Generic success response"""
 
-    message: str = Field(..., description="Success message", example="Operation completed successfully")
+    message: str = Field(..., description="Success message", examples=["Operation completed successfully"])
 
 
 class ErrorResponse(BaseModel):
     """Error response model"""
 
-    error: str = Field(..., description="Error message", example="Invalid request parameters")
+    error: str = Field(..., description="Error message", examples=["Invalid request parameters"])
     request_id: Optional[str] = Field(
         None,
         description="Request ID for tracking",
-        example="550e8400-e29b-41d4-a716-446655440000",
+        examples=["550e8400-e29b-41d4-a716-446655440000"],
     )
 
 
 class HealthResponse(BaseModel):
     """Health check response"""
 
-    status: str = Field(..., description="Service status", example="OK")
-    timestamp: str = Field(..., description="Health check timestamp", example="2025-06-31T20:00:00Z")
-    version: str = Field(..., description="API version", example="1.0.0")
+    status: str = Field(..., description="Service status", examples=["OK"])
+    timestamp: str = Field(..., description="Health check timestamp", examples=["2025-06-31T20:00:00Z"])
+    version: str = Field(..., description="API version", examples=["1.0.0"])
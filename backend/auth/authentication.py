@@ -2,9 +2,16 @@
 Authentication system with htpasswd support
 """
 
-import base64
+import asyncio
+import binascii
 import hashlib
+import hmac
+import os
+import secrets
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
@@ -13,32 +20,82 @@ import bcrypt
 from config.settings import settings
 from utils.logging import log_debug, log_error, log_warning
 
-# Authentication cache (username_hash -> (role, timestamp))
-_auth_cache: Dict[str, Tuple[str, float]] = {}
+# Authentication cache (username -> (role, keyed password digest, timestamp)).
+# Only successful logins are stored; repeated failures are absorbed by the bcrypt cache.
+_auth_cache: "OrderedDict[str, Tuple[str, bytes, float]]" = OrderedDict()
+_auth_cache_secret = secrets.token_bytes(32)
 _cache_duration = 300  # 5 minutes cache
+_cache_max_entries = 1000  # least recently used entries are evicted beyond this
 
+# Parsed htpasswd files (path -> (file stamp, users))
+_htpasswd_cache: Dict[Path, Tuple[Tuple[int, ...], Dict[str, str]]] = {}
+_htpasswd_lock = threading.Lock()
+_SMALL_FILE_SIZE = 8192
 
-def _get_cache_key(username: str, password: str) -> str:
-    """Generate cache key for username/password combination"""
-    return hashlib.sha256(f"{username}:{password}".encode()).hexdigest()
+# bcrypt verification results ((hash, HMAC(password)) -> (timestamp, result)).
+# Passwords are keyed with a per-process secret so raw values are never stored.
+_bcrypt_cache: "OrderedDict[Tuple[bytes, bytes], Tuple[float, bool]]" = OrderedDict()
+_bcrypt_cache_size = 512
+_bcrypt_cache_duration = 60
+_bcrypt_cache_secret = secrets.token_bytes(32)
+_bcrypt_lock = threading.Lock()
+
+# bcrypt releases the GIL, so a pool sized to the cores lets concurrent logins scale
+_bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+_BCRYPT_PREFIXES = frozenset(("$2y$", "$2a$", "$2b$"))
+
+
+def _password_verifier(password: str) -> bytes:
+    """Keyed digest that stands in for bcrypt once a password has been verified"""
+    return hashlib.blake2b(password.encode("utf-8"), digest_size=32, key=_auth_cache_secret).digest()
+
+
+def _file_stamp(st: os.stat_result) -> Tuple[int, ...]:
+    """Change detector for a file
+
+    A password change rewrites one hash with another of the same length, so the size alone
+    proves nothing, and coarse filesystem timestamps can miss a rewrite within the same tick.
+    The ctime and inode catch more of those cases; the user management router additionally
+    calls invalidate_htpasswd_cache() after every write.
+    """
+    return st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size
 
 
 def parse_htpasswd(file_path: Path) -> Optional[Dict[str, str]]:
-    """Parse htpasswd file"""
-    if not file_path.exists():
+    """Parse htpasswd file (cached until the file changes)"""
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
         log_warning("htpasswd file not found", {"file_path": str(file_path)})
         return None
+    except Exception as error:
+        log_error("Error reading htpasswd file", error, {"file_path": str(file_path)})
+        return None
 
-    try:
-        content = file_path.read_text()
-        users = {}
+    stamp = _file_stamp(st)
+    with _htpasswd_lock:
+        cached = _htpasswd_cache.get(file_path)
+    if cached and cached[0] == stamp:
+        # Callers (user management) mutate the result, so hand out a copy
+        return dict(cached[1]) if cached[1] else None
 
-        for line in content.split("\n"):
-            line = line.strip()
-            if line and ":" in line:
-                username, hash_value = line.split(":", 1)
-                if username and hash_value:
-                    users[username] = hash_value
+    try:
+        if st.st_size <= _SMALL_FILE_SIZE:
+            # Typical htpasswd files fit in one read; skip the buffered text IO layers
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                data = os.read(fd, _SMALL_FILE_SIZE + 1)
+            finally:
+                os.close(fd)
+            content = data.decode("utf-8") if len(data) <= _SMALL_FILE_SIZE else file_path.read_text()
+        else:
+            content = file_path.read_text()
+        # One "user:hash" entry per line; blank lines and "#" comments are skipped
+        users = {
+            username: hash_value
+            for username, _, hash_value in (line.strip().partition(":") for line in content.splitlines())
+            if hash_value and username and username[0] != "#"
+        }
 
         user_count = len(users)
         log_debug(
@@ -50,19 +107,57 @@ def parse_htpasswd(file_path: Path) -> Optional[Dict[str, str]]:
             },
         )
 
-        return users if user_count > 0 else None
+        with _htpasswd_lock:
+            _htpasswd_cache[file_path] = (stamp, users)
+
+        return dict(users) if user_count > 0 else None
 
     except Exception as error:
         log_error("Error reading htpasswd file", error, {"file_path": str(file_path)})
         return None
 
 
+def _bcrypt_cache_key(password: bytes, hash_value: bytes) -> Tuple[bytes, bytes]:
+    return hash_value, hmac.new(_bcrypt_cache_secret, password, hashlib.sha256).digest()
+
+
+def _bcrypt_cache_get(key: Tuple[bytes, bytes]) -> Optional[bool]:
+    with _bcrypt_lock:
+        cached = _bcrypt_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _bcrypt_cache_duration:
+            _bcrypt_cache.move_to_end(key)
+            return cached[1]
+    return None
+
+
+def _bcrypt_checkpw(key: Tuple[bytes, bytes], password: bytes, hash_value: bytes) -> bool:
+    """Run bcrypt.checkpw and remember the outcome"""
+    result = bcrypt.checkpw(password, hash_value)
+
+    with _bcrypt_lock:
+        _bcrypt_cache[key] = (time.monotonic(), result)
+        _bcrypt_cache.move_to_end(key)
+        while len(_bcrypt_cache) > _bcrypt_cache_size:
+            _bcrypt_cache.popitem(last=False)
+
+    return result
+
+
+def _checkpw_cached(password: bytes, hash_value: bytes) -> bool:
+    """bcrypt.checkpw with a bounded TTL/LRU cache of recent outcomes"""
+    key = _bcrypt_cache_key(password, hash_value)
+    cached = _bcrypt_cache_get(key)
+    if cached is not None:
+        return cached
+    return _bcrypt_checkpw(key, password, hash_value)
+
+
 def verify_password(password: str, hash_value: str) -> bool:
     """Verify password against hash"""
     try:
-        if hash_value.startswith("$2y$") or hash_value.startswith("$2a$") or hash_value.startswith("$2b$"):
+        if hash_value[:4] in _BCRYPT_PREFIXES:
             # Bcrypt format
-            return bcrypt.checkpw(password.encode("utf-8"), hash_value.encode("utf-8"))
+            return _checkpw_cached(password.encode("utf-8"), hash_value.encode("utf-8"))
         elif hash_value.startswith("$apr1$"):
             # Apache MD5 - not implemented
             log_warning(
@@ -76,63 +171,190 @@ def verify_password(password: str, hash_value: str) -> bool:
                 "Using plain text password (insecure)",
                 {"suggestion": "Please use bcrypt hashed passwords"},
             )
-            return password == hash_value
+            return hmac.compare_digest(password.encode("utf-8"), hash_value.encode("utf-8"))
+    except Exception as e:
+        log_error("Error verifying password", e)
+        return False
+
+
+async def verify_password_async(password: str, hash_value: str) -> bool:
+    """Verify password against hash without blocking the event loop on bcrypt"""
+    if hash_value[:4] not in _BCRYPT_PREFIXES:
+        return verify_password(password, hash_value)
+
+    try:
+        password_bytes = password.encode("utf-8")
+        hash_bytes = hash_value.encode("utf-8")
+        key = _bcrypt_cache_key(password_bytes, hash_bytes)
+        cached = _bcrypt_cache_get(key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_bcrypt_pool, _bcrypt_checkpw, key, password_bytes, hash_bytes)
     except Exception as e:
         log_error("Error verifying password", e)
         return False
 
 
-def is_admin_user(username: str, password: str) -> bool:
+class AuthStore:
+    """Pre-parsed admin and uploader htpasswd users, refreshed when either file changes"""
+
+    def __init__(self, admin_path: Path, uploader_path: Path):
+        """Initialize store and load both htpasswd files"""
+        self.admin_path = admin_path
+        self.uploader_path = uploader_path
+        self.admin: Dict[str, str] = {}
+        self.uploader: Dict[str, str] = {}
+        self._stamps: Tuple[Optional[Tuple[int, ...]], ...] = ()
+        # Bumped on every reload or invalidation, so callers can tell whether the user
+        # dicts changed while they were awaiting a password check
+        self.generation = 0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    @staticmethod
+    def _stamp(file_path: Path) -> Optional[Tuple[int, ...]]:
+        try:
+            return _file_stamp(file_path.stat())
+        except OSError:
+            return None
+
+    def refresh(self):
+        """Reload the user dicts if either file was created, changed or removed"""
+        stamps = (self._stamp(self.admin_path), self._stamp(self.uploader_path))
+        if stamps == self._stamps:
+            return
+
+        with self._lock:
+            if stamps == self._stamps:
+                return
+            self.admin = parse_htpasswd(self.admin_path) or {}
+            self.uploader = parse_htpasswd(self.uploader_path) or {}
+            self._stamps = stamps
+            self.generation += 1
+            # Roles resolved against the old files may no longer be valid
+            _auth_cache.clear()
+
+    def invalidate(self):
+        """Force the next refresh() to reload both files"""
+        with self._lock:
+            self._stamps = ()
+            self.generation += 1
+
+    def knows(self, username: str) -> bool:
+        """Whether the username appears in either htpasswd file"""
+        return username in self.admin or username in self.uploader
+
+    async def check(self, users: Dict[str, str], username: str, password: str) -> bool:
+        """Verify credentials against one of the user dicts"""
+        hash_value = users.get(username)
+        return hash_value is not None and await verify_password_async(password, hash_value)
+
+    async def role_of(self, username: str, password: str) -> Optional[str]:
+        """Resolve the role for a username/password pair (at most one password check)"""
+        self.refresh()
+        # Pick the file by membership first so a failed admin check never pays
+        # for a second bcrypt round against the uploader file
+        if username in self.admin:
+            return "admin" if await self.check(self.admin, username, password) else None
+        if username in self.uploader:
+            return "uploader" if await self.check(self.uploader, username, password) else None
+        return None
+
+
+_auth_store: Optional[AuthStore] = None
+
+
+def init_auth_store() -> AuthStore:
+    """Create the process-wide auth store from the configured htpasswd paths"""
+    global _auth_store
+    _auth_store = AuthStore(settings.htpasswd_path, settings.htuploaders_path)
+    return _auth_store
+
+
+def get_auth_store() -> AuthStore:
+    """Get the auth store (FastAPI dependency), creating it on first use"""
+    return _auth_store or init_auth_store()
+
+
+def invalidate_htpasswd_cache():
+    """Forget parsed htpasswd files and cached roles (call after rewriting an htpasswd file)"""
+    with _htpasswd_lock:
+        _htpasswd_cache.clear()
+    if _auth_store is not None:
+        _auth_store.invalidate()
+    _auth_cache.clear()
+
+
+async def is_admin_user(username: str, password: str) -> bool:
     """Check if user has admin privileges"""
-    htpasswd_users = parse_htpasswd(settings.htpasswd_path)
-    if not htpasswd_users or username not in htpasswd_users:
+    store = get_auth_store()
+    store.refresh()
+    if username not in store.admin:
         log_debug(
             "Admin authentication failed",
             {
                 "username": username,
-                "reason": ("no_htpasswd_file" if not htpasswd_users else "user_not_found"),
+                "reason": ("no_htpasswd_file" if not store.admin else "user_not_found"),
             },
         )
         return False
 
-    hash_value = htpasswd_users[username]
-    is_valid = verify_password(password, hash_value)
+    is_valid = await store.check(store.admin, username, password)
 
     log_debug("Admin authentication attempt", {"username": username, "success": is_valid})
 
     return is_valid
 
 
-def is_uploader_user(username: str, password: str) -> bool:
+async def is_uploader_user(username: str, password: str) -> bool:
     """Check if user has upload-only privileges"""
-    htuploaders_users = parse_htpasswd(settings.htuploaders_path)
-    if not htuploaders_users or username not in htuploaders_users:
+    store = get_auth_store()
+    store.refresh()
+    if username not in store.uploader:
         log_debug(
             "Uploader authentication failed",
             {
                 "username": username,
-                "reason": ("no_htuploaders_file" if not htuploaders_users else "user_not_found"),
+                "reason": ("no_htuploaders_file" if not store.uploader else "user_not_found"),
             },
         )
         return False
 
-    hash_value = htuploaders_users[username]
-    is_valid = verify_password(password, hash_value)
+    is_valid = await store.check(store.uploader, username, password)
 
     log_debug("Uploader authentication attempt", {"username": username, "success": is_valid})
 
     return is_valid
 
 
-def get_user_role(username: str, password: str) -> Optional[str]:
-    """Get user role with caching"""
-    cache_key = _get_cache_key(username, password)
-    current_time = time.time()
+async def get_user_role(username: str, password: str, now: Optional[float] = None) -> Optional[str]:
+    """Get user role with caching (``now`` is a time.monotonic() value, e.g. the request start)"""
+    # Reload changed htpasswd files first so cached roles never outlive the user entries
+    store = get_auth_store()
+    store.refresh()
 
-    # Check cache first
-    if cache_key in _auth_cache:
-        role, timestamp = _auth_cache[cache_key]
-        if current_time - timestamp < _cache_duration:
+    # Unknown usernames are rejected with a dict lookup, before hashing or caching anything.
+    # Like the per-file checks, this answers faster for unknown users than for wrong
+    # passwords, which is acceptable for this self-hosted admin tool.
+    if not store.knows(username):
+        log_debug("Authentication failed - unknown user", {"username": username})
+        return None
+
+    verifier = _password_verifier(password)
+    current_time = time.monotonic() if now is None else now
+
+    # Check cache first: a fresh entry whose verifier matches skips bcrypt entirely
+    cached = _auth_cache.get(username)
+    if cached:
+        role, cached_verifier, timestamp = cached
+        if current_time - timestamp >= _cache_duration:
+            # Cache expired, remove it
+            del _auth_cache[username]
+            log_debug("Authentication cache expired", {"username": username})
+        elif hmac.compare_digest(verifier, cached_verifier):
+            _auth_cache.move_to_end(username)
             log_debug(
                 "Authentication cache hit",
                 {
@@ -142,28 +364,20 @@ def get_user_role(username: str, password: str) -> Optional[str]:
                 },
             )
             return role
-        else:
-            # Cache expired, remove it
-            del _auth_cache[cache_key]
-            log_debug("Authentication cache expired", {"username": username})
+        # A different password falls through to bcrypt; the entry stays for the real user
 
     # Cache miss - do actual authentication
     log_debug("Authentication cache miss", {"username": username})
-    role = None
-    if is_admin_user(username, password):
-        role = "admin"
-    elif is_uploader_user(username, password):
-        role = "uploader"
-
-    # Cache the result (even if None, to avoid repeated bcrypt calls for invalid users)
-    _auth_cache[cache_key] = (role, current_time)
-
-    # Clean old cache entries periodically (simple cleanup)
-    if len(_auth_cache) > 100:  # Arbitrary limit
-        expired_keys = [k for k, (_, ts) in _auth_cache.items() if current_time - ts > _cache_duration]
-        for key in expired_keys:
-            del _auth_cache[key]
-        log_debug("Cleaned expired auth cache entries", {"removed": len(expired_keys)})
+    generation = store.generation
+    role = await store.role_of(username, password)
+
+    # A reload or invalidation during the bcrypt check may have retired these credentials,
+    # so only cache roles resolved against files that are still current
+    if role and store.generation == generation:
+        _auth_cache[username] = (role, verifier, current_time)
+        _auth_cache.move_to_end(username)
+        while len(_auth_cache) > _cache_max_entries:
+            _auth_cache.popitem(last=False)
 
     return role
 
@@ -174,12 +388,11 @@ def parse_auth_header(auth_header: str) -> Optional[Tuple[str, str]]:
         return None
 
     try:
-        credentials = base64.b64decode(auth_header[6:]).decode("utf-8")
-        if ":" not in credentials:
+        username, sep, password = binascii.a2b_base64(auth_header[6:]).partition(b":")
+        if not sep:
             return None
 
-        username, password = credentials.split(":", 1)
-        return username, password
-    except Exception as e:
-        log_error("Error parsing auth header", e)
+        return username.decode("utf-8"), password.decode("utf-8")
+    except (binascii.Error, ValueError) as e:
+        log_debug("Malformed Basic auth header", {"error": str(e)})
         return None
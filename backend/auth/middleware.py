@@ -5,12 +5,12 @@ Authentication middleware for FastAPI
 from typing import Optional
 
 from fastapi import HTTPException, Request
-from fastapi.security import HTTPBasic
 
 from auth.authentication import get_user_role, parse_auth_header
-from utils.logging import log_debug, log_info
+from utils.logging import debug_enabled, log_debug, log_info
 
-security = HTTPBasic()
+# Marks request.state.user as not yet resolved (None means "resolved, not authenticated")
+_UNRESOLVED = object()
 
 
 class User:
@@ -22,116 +22,138 @@ class User:
         self.role = role
 
 
-def get_current_user(request: Request) -> Optional[User]:
-    """Get current user from request"""
-    request_id = getattr(request.state, "request_id", "unknown")
+def _client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+async def get_current_user(request: Request) -> Optional[User]:
+    """Get current user from request (resolved once per request)"""
+    user = getattr(request.state, "user", _UNRESOLVED)
+    if user is _UNRESOLVED:
+        user = await _authenticate(request)
+        request.state.user = user
+    return user
 
-    # Log all headers for debugging
-    log_debug(
-        "Auth check - all headers",
-        {"request_id": request_id, "headers": dict(request.headers)},
-    )
+
+async def _authenticate(request: Request) -> Optional[User]:
+    """Resolve the user from the Authorization header"""
+    # Debug context dicts are only built when debug logging is actually enabled
+    debug = debug_enabled()
+    request_id = getattr(request.state, "request_id", "unknown")
 
     auth_header = request.headers.get("authorization")
-    log_debug(
-        "Auth check - authorization header",
-        {
-            "request_id": request_id,
-            "auth_header_present": auth_header is not None,
-            "auth_header_value": (auth_header[:20] + "..." if auth_header and len(auth_header) > 20 else auth_header),
-        },
-    )
+    if debug:
+        log_debug(
+            "Auth check - authorization header",
+            {
+                "request_id": request_id,
+                "auth_header_present": auth_header is not None,
+                "auth_header_value": (auth_header[:20] + "..." if auth_header and len(auth_header) > 20 else auth_header),
+            },
+        )
 
     if not auth_header:
-        log_debug("Auth check - no authorization header", {"request_id": request_id})
+        if debug:
+            log_debug("Auth check - no authorization header", {"request_id": request_id})
         return None
 
     credentials = parse_auth_header(auth_header)
     if not credentials:
-        log_debug(
-            "Auth check - failed to parse auth header",
-            {"request_id": request_id, "auth_header": auth_header},
-        )
+        if debug:
+            log_debug(
+                "Auth check - failed to parse auth header",
+                {"request_id": request_id, "auth_header": auth_header},
+            )
         return None
 
     username, password = credentials
-    log_debug(
-        "Auth check - parsed credentials",
-        {
-            "request_id": request_id,
-            "username": username,
-            "password_length": len(password) if password else 0,
-        },
-    )
-
-    role = get_user_role(username, password)
-    log_debug(
-        "Auth check - role lookup result",
-        {"request_id": request_id, "username": username, "role": role},
-    )
+    if debug:
+        log_debug(
+            "Auth check - parsed credentials",
+            {
+                "request_id": request_id,
+                "username": username,
+                "password_length": len(password) if password else 0,
+            },
+        )
 
-    if role:
+    # Reuse the request start time recorded by the logging middleware for the cache TTL check
+    role = await get_user_role(username, password, getattr(request.state, "started_at", None))
+    if debug:
         log_debug(
-            "Auth check - user authenticated successfully",
+            "Auth check - role lookup result",
             {"request_id": request_id, "username": username, "role": role},
         )
+
+    if role:
+        if debug:
+            log_debug(
+                "Auth check - user authenticated successfully",
+                {"request_id": request_id, "username": username, "role": role},
+            )
         return User(username, role)
 
-    log_debug(
-        "Auth check - authentication failed",
-        {
-            "request_id": request_id,
-            "username": username,
-            "reason": "invalid_credentials",
-        },
-    )
+    if debug:
+        log_debug(
+            "Auth check - authentication failed",
+            {
+                "request_id": request_id,
+                "username": username,
+                "reason": "invalid_credentials",
+            },
+        )
     return None
 
 
-def require_auth(request: Request) -> User:
+async def require_auth(request: Request) -> User:
     """Require any valid user (admin or uploader)"""
-    user = get_current_user(request)
+    user = await get_current_user(request)
+    request_id = getattr(request.state, "request_id", "unknown")
 
     if not user:
-        log_debug(
-            "Authentication denied - no valid credentials",
-            {
-                "request_id": getattr(request.state, "request_id", "unknown"),
-                "ip": request.client.host if request.client else "unknown",
-                "user_agent": request.headers.get("user-agent", "unknown"),
-            },
-        )
+        if debug_enabled():
+            log_debug(
+                "Authentication denied - no valid credentials",
+                {
+                    "request_id": request_id,
+                    "ip": _client_ip(request),
+                    "user_agent": request.headers.get("user-agent", "unknown"),
+                },
+            )
         raise HTTPException(
             status_code=401,
             detail="Authentication required",
         )
 
-    log_debug(
-        "Authentication successful",
-        {
-            "request_id": getattr(request.state, "request_id", "unknown"),
-            "username": user.username,
-            "role": user.role,
-            "ip": request.client.host if request.client else "unknown",
-        },
-    )
+    if debug_enabled():
+        log_debug(
+            "Authentication successful",
+            {
+                "request_id": request_id,
+                "username": user.username,
+                "role": user.role,
+                "ip": _client_ip(request),
+            },
+        )
 
     return user
 
 
-def require_admin(request: Request) -> User:
+async def require_admin(request: Request) -> User:
     """Require admin access"""
-    user = get_current_user(request)
+    user = await get_current_user(request)
+    request_id = getattr(request.state, "request_id", "unknown")
 
     if not user:
-        log_debug(
-            "Admin access denied - no auth header",
-            {
-                "request_id": getattr(request.state, "request_id", "unknown"),
-                "ip": request.client.host if request.client else "unknown",
-                "user_agent": request.headers.get("user-agent", "unknown"),
-            },
-        )
+        if debug_enabled():
+            log_debug(
+                "Admin access denied - no auth header",
+                {
+                    "request_id": request_id,
+                    "ip": _client_ip(request),
+                    "user_agent": request.headers.get("user-agent", "unknown"),
+                },
+            )
         raise HTTPException(
             status_code=401,
             detail="Authentication required",
@@ -141,10 +163,10 @@ def require_admin(request: Request) -> User:
         log_info(
             "Admin access denied - insufficient privileges",
             {
-                "request_id": getattr(request.state, "request_id", "unknown"),
+                "request_id": request_id,
                 "username": user.username,
                 "role": user.role,
-                "ip": request.client.host if request.client else "unknown",
+                "ip": _client_ip(request),
             },
         )
         raise HTTPException(
@@ -155,28 +177,30 @@ def require_admin(request: Request) -> User:
     log_info(
         "Admin access granted",
         {
-            "request_id": getattr(request.state, "request_id", "unknown"),
+            "request_id": request_id,
             "username": user.username,
-            "ip": request.client.host if request.client else "unknown",
+            "ip": _client_ip(request),
         },
     )
 
     return user
 
 
-def require_uploader(request: Request) -> User:
+async def require_uploader(request: Request) -> User:
     """Require upload access (admin or uploader users)"""
-    user = get_current_user(request)
+    user = await get_current_user(request)
+    request_id = getattr(request.state, "request_id", "unknown")
 
     if not user:
-        log_debug(
-            "Upload access denied - no auth header",
-            {
-                "request_id": getattr(request.state, "request_id", "unknown"),
-                "ip": request.client.host if request.client else "unknown",
-                "user_agent": request.headers.get("user-agent", "unknown"),
-            },
-        )
+        if debug_enabled():
+            log_debug(
+                "Upload access denied - no auth header",
+                {
+                    "request_id": request_id,
+                    "ip": _client_ip(request),
+                    "user_agent": request.headers.get("user-agent", "unknown"),
+                },
+            )
         raise HTTPException(
             status_code=401,
             detail="Authentication required",
@@ -186,10 +210,10 @@ def require_uploader(request: Request) -> User:
         log_info(
             "Upload access denied - insufficient privileges",
             {
-                "request_id": getattr(request.state, "request_id", "unknown"),
+                "request_id": request_id,
                 "username": user.username,
                 "role": user.role,
-                "ip": request.client.host if request.client else "unknown",
+                "ip": _client_ip(request),
             },
         )
         raise HTTPException(
@@ -200,10 +224,10 @@ def require_uploader(request: Request) -> User:
     log_info(
         "Upload access granted",
         {
-            "request_id": getattr(request.state, "request_id", "unknown"),
+            "request_id": request_id,
             "username": user.username,
             "role": user.role,
-            "ip": request.client.host if request.client else "unknown",
+            "ip": _client_ip(request),
         },
     )
 
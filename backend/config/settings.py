@@ -3,6 +3,7 @@ Application settings and configuration
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 
 
@@ -23,14 +24,20 @@ class Settings:
         # Server configuration
         self.port = int(os.getenv("PORT", "8000"))
         self.host = os.getenv("HOST", "0.0.0.0")
+        # Worker processes (opt-in; each one opens its own writer, reader pool and bcrypt threads)
+        self.workers = int(os.getenv("WORKERS") or 1)
+
+        # CORS configuration (comma-separated origins; empty disables CORS for same-origin deployments)
+        self.cors_origins = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
 
         # Upload configuration
         self.upload_dir = self.base_dir / "uploads"
         self.max_upload_size = 50 * 1024 * 1024  # 50MB
 
-        # Ensure directories exist
-        self.db_path.parent.mkdir(exist_ok=True)
-        self.upload_dir.mkdir(exist_ok=True)
+        # Ensure directories exist (a stat is enough once they have been created)
+        for directory in (self.db_path.parent, self.upload_dir):
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
 
         # Version configuration - check multiple locations
         # In development: ../VERSION (relative to backend/)
@@ -44,9 +51,9 @@ class Settings:
         """Get database URL"""
         return f"sqlite:///{self.db_path}"
 
-    @property
+    @cached_property
     def version(self) -> str:
-        """Get application version from VERSION file"""
+        """Get application version from VERSION file (read once; it only changes on deploy)"""
         try:
             if self.version_file.exists():
                 return self.version_file.read_text().strip()
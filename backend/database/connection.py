@@ -2,9 +2,14 @@
 Database connection and initialization
 """
 
+import queue
 import sqlite3
-from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException
 
 from config.settings import settings
 from utils.helpers import (
@@ -16,6 +21,97 @@ from utils.helpers import (
 )
 from utils.logging import log_error, log_info
 
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks, single-worker only
+    fcntl = None
+
+# Connection tuning: a 64 MiB page cache, 256 MiB of memory-mapped I/O and a busy wait
+# instead of immediate "database is locked" errors. WAL is applied separately since
+# in-memory databases cannot use it.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Read-only connections handed to GET endpoints so reads run beside the writer under WAL
+READ_POOL_SIZE = 4
+# How long a request waits for a free reader before it is answered with 503
+READER_WAIT_TIMEOUT = 10.0
+
+
+@lru_cache(maxsize=None)
+def insert_statement(table: str, columns: Tuple[str, ...], verb: str = "INSERT") -> str:
+    """INSERT statement for a fixed table and column tuple, built once and then reused"""
+    return f"{verb} INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+
+# Columns written by _populate_sample_data, in insert order
+SAMPLE_DATA_COLUMNS = (
+    "timestamp",
+    "test_date",
+    "drive_model",
+    "drive_type",
+    "test_name",
+    "block_size",
+    "read_write_pattern",
+    "queue_depth",
+    "duration",
+    "fio_version",
+    "job_runtime",
+    "rwmixread",
+    "total_ios_read",
+    "total_ios_write",
+    "usr_cpu",
+    "sys_cpu",
+    "hostname",
+    "protocol",
+    "description",
+    "uploaded_file_path",
+    "output_file",
+    "num_jobs",
+    "direct",
+    "test_size",
+    "sync",
+    "iodepth",
+    "avg_latency",
+    "bandwidth",
+    "iops",
+    "p70_latency",
+    "p90_latency",
+    "p95_latency",
+    "p99_latency",
+    "is_latest",
+)
+_sample_row = itemgetter(*SAMPLE_DATA_COLUMNS)
+INSERT_SAMPLE_DATA_SQL = insert_statement("test_runs_all", SAMPLE_DATA_COLUMNS)
+COPY_SAMPLE_DATA_SQL = (
+    f"INSERT OR REPLACE INTO test_runs ({', '.join(SAMPLE_DATA_COLUMNS)}) "
+    f"SELECT {', '.join(SAMPLE_DATA_COLUMNS)} FROM test_runs_all ORDER BY id"
+)
+
+# Clears is_latest on earlier runs of the same configuration (see update_latest_flags)
+LATEST_FLAGS_KEYS = (
+    "drive_type",
+    "drive_model",
+    "hostname",
+    "protocol",
+    "block_size",
+    "read_write_pattern",
+    "output_file",
+    "num_jobs",
+    "direct",
+    "test_size",
+    "sync",
+    "iodepth",
+)
+UPDATE_LATEST_FLAGS_SQL = (
+    "UPDATE test_runs SET is_latest = 0 WHERE " + " AND ".join(f"{key} = ?" for key in LATEST_FLAGS_KEYS)
+)
+
 
 class DatabaseManager:
     """Database connection manager"""
@@ -23,6 +119,8 @@ class DatabaseManager:
     def __init__(self):
         self.db_path = settings.db_path
         self._connection: Optional[sqlite3.Connection] = None
+        self._readers: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+        self._reader_connections: List[sqlite3.Connection] = []
 
     async def connect(self):
         """Initialize database connection"""
@@ -31,20 +129,72 @@ class DatabaseManager:
         try:
             self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
             self._connection.row_factory = sqlite3.Row  # Enable column access by name
+            self._configure_connection(self._connection)
 
             log_info(
                 "Connected to SQLite database successfully",
                 {"db_path": str(self.db_path)},
             )
             await self._init_schema()
+            self._open_readers()
 
         except Exception as e:
             log_error("Error opening database", e, {"db_path": str(self.db_path)})
             raise
 
+    def _configure_connection(self, connection: sqlite3.Connection, writer: bool = True):
+        """Apply journal mode and performance PRAGMAs to a fresh connection"""
+        if writer and ":memory:" not in str(self.db_path):
+            # WAL lets readers proceed during writes and turns per-commit fsyncs into checkpoints
+            connection.execute("PRAGMA journal_mode=WAL")
+        for pragma in CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+
+    def _open_readers(self):
+        """Open the read-only connection pool (in-memory databases share the writer)"""
+        if ":memory:" in str(self.db_path):
+            return
+
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        for _ in range(READ_POOL_SIZE):
+            reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            reader.row_factory = sqlite3.Row
+            self._configure_connection(reader, writer=False)
+            self._reader_connections.append(reader)
+            self._readers.put(reader)
+
+    def acquire_reader(self) -> sqlite3.Connection:
+        """Take a read-only connection (in-memory databases have none and share the writer)
+
+        Called from FastAPI's threadpool (get_db_ro is a sync dependency), so waiting for a
+        reader does not block the event loop. The writer is never handed out here: it may be
+        in the middle of an import transaction on the event loop thread.
+
+        Raises:
+            queue.Empty: No reader became free within READER_WAIT_TIMEOUT
+        """
+        if not self._reader_connections:
+            return self.connection
+        return self._readers.get(timeout=READER_WAIT_TIMEOUT)
+
+    def release_reader(self, connection: sqlite3.Connection):
+        """Return a connection obtained from acquire_reader()"""
+        if connection is not self._connection and connection in self._reader_connections:
+            self._readers.put(connection)
+
     async def close(self):
         """Close database connection"""
+        for reader in self._reader_connections:
+            reader.close()
+        self._reader_connections.clear()
+        self._readers = queue.SimpleQueue()
+
         if self._connection:
+            try:
+                # Refresh query planner statistics for tables whose usage warrants it
+                self._connection.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                log_error("Error optimizing database", e)
             self._connection.close()
             self._connection = None
             log_info("Database connection closed")
@@ -56,10 +206,46 @@ class DatabaseManager:
             raise RuntimeError("Database not connected. Call connect() first.")
         return self._connection
 
+    def _schema_lock(self):
+        """Exclusive lock on a file beside the database, held while the schema is initialized
+
+        With several uvicorn workers, each one runs startup; the lock makes them migrate one
+        after another, so later workers only repeat the idempotent checks on an initialized
+        database instead of waiting on the write lock and timing out with "database is locked".
+        """
+        if fcntl is None or ":memory:" in str(self.db_path):
+            return nullcontext()
+        return self._locked_file(self.db_path.with_name(self.db_path.name + ".init.lock"))
+
+    @staticmethod
+    @contextmanager
+    def _locked_file(path):
+        with open(path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
     async def _init_schema(self):
         """Initialize database schema"""
         cursor = self.connection.cursor()
 
+        # SQLite DDL is transactional, so tables, migrations, sample data, indexes and views
+        # are applied in one write transaction with a single commit instead of one per statement
+        with self._schema_lock():
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                await self._create_schema(cursor)
+            except Exception:
+                self.connection.rollback()
+                raise
+
+            self.connection.commit()
+        show_server_ready(settings.port)
+
+    async def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables, run migrations, populate sample data and create indexes and views"""
         # Create test_runs_all table for all historical data
         cursor.execute(
             """
@@ -189,12 +375,6 @@ class DatabaseManager:
         # Run automatic migrations
         self._run_migrations(cursor)
 
-        # Create indexes
-        self._create_indexes(cursor)
-
-        # Create views
-        self._create_views(cursor)
-
         # Check if we need sample data
         cursor.execute("SELECT COUNT(*) as count FROM test_runs")
         latest_count = cursor.fetchone()[0]
@@ -206,8 +386,11 @@ class DatabaseManager:
             log_info("Populating sample data...")
             await self._populate_sample_data(cursor)
 
-        self.connection.commit()
-        show_server_ready(settings.port)
+        # Create indexes after any bulk load so they are built once instead of per row
+        self._create_indexes(cursor)
+
+        # Create views
+        self._create_views(cursor)
 
     def _create_indexes(self, cursor: sqlite3.Cursor):
         """Create database indexes"""
@@ -228,6 +411,21 @@ class DatabaseManager:
                 "test_runs",
                 "hostname, protocol, drive_type, drive_model",
             ),
+            # Let the timestamp-ordered test run listings stream rows instead of sorting them
+            ("idx_test_runs_timestamp", "test_runs", "timestamp DESC"),
+            (
+                "idx_test_runs_host_model_time",
+                "test_runs",
+                "hostname, drive_model, timestamp DESC",
+            ),
+            # Exactly the update_latest_flags WHERE columns; the UNIQUE autoindex stops at
+            # read_write_pattern because that statement does not filter on queue_depth
+            (
+                "idx_test_runs_latest_flags",
+                "test_runs",
+                "hostname, protocol, drive_type, drive_model, block_size, read_write_pattern, "
+                "output_file, num_jobs, direct, test_size, sync, iodepth",
+            ),
         ]
 
         for index_name, table_name, columns in indexes:
@@ -266,15 +464,25 @@ class DatabaseManager:
         """
         import hashlib
 
+        # Hostnames and per-day run seeds repeat across rows, so each is hashed only once
+        uuid_cache: Dict[str, str] = {}
+
         def generate_uuid_from_hash(input_string: str) -> str:
             """Generate UUID5 from SHA256 hash"""
-            hash_bytes = hashlib.sha256(input_string.encode('utf-8')).digest()
-            uuid_bytes = bytearray(hash_bytes[:16])
+            cached = uuid_cache.get(input_string)
+            if cached is not None:
+                return cached
+
+            # SHA-256 (not blake2b) so UUIDs match scripts/fio-test.sh; not a security use of the hash
+            digest = hashlib.sha256(input_string.encode('utf-8'), usedforsecurity=False).digest()
+            uuid_bytes = bytearray(digest[:16])
             uuid_bytes[6] = (uuid_bytes[6] & 0x0F) | 0x50  # Version 5
             uuid_bytes[8] = (uuid_bytes[8] & 0x3F) | 0x80  # RFC 4122 variant
 
-            import uuid as uuid_module
-            return str(uuid_module.UUID(bytes=bytes(uuid_bytes)))
+            # Format directly instead of round-tripping through uuid.UUID
+            h = uuid_bytes.hex()
+            result = uuid_cache[input_string] = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+            return result
 
         # Migration 1: Add UUID columns
         for table_name in ['test_runs_all', 'test_runs']:
@@ -298,13 +506,17 @@ class DatabaseManager:
             if needs_migration:
                 log_info(f"Backfilling UUIDs in {table_name}...")
 
-                cursor.execute(f"""
+                # Rows are only unpacked positionally, so read plain tuples in bounded batches
+                legacy = self.connection.cursor()
+                legacy.row_factory = None
+                legacy.execute(f"""
                     SELECT id, hostname, protocol, drive_type, drive_model, description, test_date, timestamp
                     FROM {table_name}
                     WHERE config_uuid IS NULL OR run_uuid IS NULL
                 """)
 
-                records = cursor.fetchall()
+                records = (record for batch in iter(lambda: legacy.fetchmany(1000), []) for record in batch)
+                updates = []
                 for record_id, hostname, protocol, drive_type, drive_model, description, test_date, timestamp in records:
                     if not hostname:
                         hostname = "unknown"
@@ -333,13 +545,18 @@ class DatabaseManager:
                     hash_seed = "_".join(meta_fields)
                     run_uuid = generate_uuid_from_hash(hash_seed)
 
-                    cursor.execute(f"""
-                        UPDATE {table_name}
-                        SET config_uuid = ?, run_uuid = ?
-                        WHERE id = ?
-                    """, (config_uuid, run_uuid, record_id))
+                    updates.append((config_uuid, run_uuid, record_id))
+
+                # One prepared statement for the whole backfill, inside the migration transaction
+                cursor.executemany(f"""
+                    UPDATE {table_name}
+                    SET config_uuid = ?, run_uuid = ?
+                    WHERE id = ? AND (config_uuid IS NULL OR run_uuid IS NULL)
+                """, updates)
 
-                log_info(f"Backfilled {len(records)} records in {table_name}")
+                legacy.close()
+
+                log_info(f"Backfilled {len(updates)} records in {table_name}")
 
         # Migration 2: Add all latency percentile columns
         percentile_columns = [
@@ -439,8 +656,6 @@ class DatabaseManager:
             )
             log_info("saturation_runs table created with indexes")
 
-        self.connection.commit()
-
     async def _populate_sample_data(self, cursor: sqlite3.Cursor):
         """Populate sample data"""
         import random
@@ -480,30 +695,49 @@ class DatabaseManager:
         queue_depths = [1, 4, 8, 16]
 
         test_runs_data = []
+        now = datetime.now(timezone.utc)
+
+        # Base metrics only depend on (drive_type, pattern, block_size), so build the table once
+        drive_types = {drive_type for server in servers for _, drive_type in server["drives"]}
+        base_metrics = {
+            (drive_type, pattern, block_size): (
+                get_base_iops(drive_type, pattern, block_size),
+                get_base_latency(drive_type, pattern),
+                get_base_bandwidth(drive_type, pattern, block_size),
+            )
+            for drive_type in drive_types
+            for pattern in patterns
+            for block_size in block_sizes
+        }
 
         # Generate test data for each server
         for server in servers:
             for drive_model, drive_type in server["drives"]:
-                for day_offset in range(0, 30, 2 + random.randint(0, 3)):
-                    timestamp = (datetime.now(timezone.utc) - timedelta(days=day_offset)).isoformat()
-
-                    block_size = random.choice(block_sizes)
-                    pattern = random.choice(patterns)
-                    queue_depth = random.choice(queue_depths)
+                day_offsets = range(0, 30, 2 + random.randint(0, 3))
+                n = len(day_offsets)
+
+                # Draw every random choice for this drive up front, one column at a time
+                columns_drawn = zip(
+                    day_offsets,
+                    random.choices(block_sizes, k=n),
+                    random.choices(patterns, k=n),
+                    random.choices(queue_depths, k=n),
+                    random.choices([1, 2, 4, 8], k=n),
+                    random.choices([0, 1], k=n),
+                    random.choices(["1M", "10M", "100M", "1G"], k=n),
+                    random.choices([1, 4, 8, 16, 32], k=n),
+                )
+                for day_offset, block_size, pattern, queue_depth, num_jobs, direct_io, test_size, iodepth in columns_drawn:
+                    timestamp = (now - timedelta(days=day_offset)).isoformat()
 
                     test_name = f"{server['hostname']}_{pattern}_{block_size}"
 
                     # Calculate realistic metrics
-                    fake_iops = int(get_base_iops(drive_type, pattern, block_size) * (0.8 + random.random() * 0.4))
-                    fake_latency = get_base_latency(drive_type, pattern) * (0.8 + random.random() * 0.4)
-                    fake_bandwidth = int(get_base_bandwidth(drive_type, pattern, block_size) * (0.8 + random.random() * 0.4))
-
-                    # Generate job options
-                    num_jobs = random.choice([1, 2, 4, 8])
-                    direct_io = random.choice([0, 1])
+                    base_iops, base_latency, base_bandwidth = base_metrics[(drive_type, pattern, block_size)]
+                    fake_iops = int(base_iops * (0.8 + random.random() * 0.4))
+                    fake_latency = base_latency * (0.8 + random.random() * 0.4)
+                    fake_bandwidth = int(base_bandwidth * (0.8 + random.random() * 0.4))
                     sync_mode = 1 if random.random() > 0.7 else 0
-                    test_size = random.choice(["1M", "10M", "100M", "1G"])
-                    iodepth = random.choice([1, 4, 8, 16, 32])
 
                     test_data = {
                         "timestamp": timestamp,
@@ -544,26 +778,22 @@ class DatabaseManager:
 
                     test_runs_data.append(test_data)
 
-        # Insert test runs
-        columns = list(test_runs_data[0].keys())
-        placeholders = ", ".join(["?" for _ in columns])
+        # Insert into test_runs_all (statement and row getter are built once at import); map
+        # feeds executemany lazily, so no second list of parameter tuples is materialized
+        cursor.executemany(INSERT_SAMPLE_DATA_SQL, map(_sample_row, test_runs_data))
 
-        # Insert into test_runs_all
-        cursor.executemany(
-            f"INSERT INTO test_runs_all ({', '.join(columns)}) VALUES ({placeholders})",
-            [tuple(test_data[col] for col in columns) for test_data in test_runs_data],
-        )
-
-        # Insert into test_runs (with conflict resolution)
-        cursor.executemany(
-            f"INSERT OR REPLACE INTO test_runs ({', '.join(columns)}) VALUES ({placeholders})",
-            [tuple(test_data[col] for col in columns) for test_data in test_runs_data],
-        )
+        # Copy into test_runs (with conflict resolution) inside SQLite instead of binding every
+        # row again; the table was empty, and rowid order keeps "last insert wins" semantics
+        cursor.execute(COPY_SAMPLE_DATA_SQL)
 
         log_info(f"Sample data generation complete: {len(test_runs_data)} test runs")
 
-    async def update_latest_flags(self, test_run_data: Dict[str, Any]):
-        """Update latest flags for existing test runs"""
+    async def update_latest_flags(self, test_run_data: Dict[str, Any], commit: bool = True):
+        """Update latest flags for existing test runs
+
+        Pass commit=False to leave the UPDATE in the open transaction so the caller can commit
+        it together with the insert of the new run.
+        """
         cursor = self.connection.cursor()
         unique_key = calculate_unique_key(test_run_data)
 
@@ -576,32 +806,11 @@ class DatabaseManager:
             },
         )
 
-        # Update existing tests to not be latest
-        cursor.execute(
-            """
-            UPDATE test_runs
-            SET is_latest = 0
-            WHERE drive_type = ? AND drive_model = ? AND hostname = ? AND protocol = ?
-            AND block_size = ? AND read_write_pattern = ? AND output_file = ? AND num_jobs = ?
-            AND direct = ? AND test_size = ? AND sync = ? AND iodepth = ?
-        """,
-            (
-                test_run_data.get("drive_type"),
-                test_run_data.get("drive_model"),
-                test_run_data.get("hostname"),
-                test_run_data.get("protocol"),
-                test_run_data.get("block_size"),
-                test_run_data.get("read_write_pattern"),
-                test_run_data.get("output_file"),
-                test_run_data.get("num_jobs"),
-                test_run_data.get("direct"),
-                test_run_data.get("test_size"),
-                test_run_data.get("sync"),
-                test_run_data.get("iodepth"),
-            ),
-        )
+        # Update existing tests to not be latest (missing keys bind as NULL, like dict.get)
+        cursor.execute(UPDATE_LATEST_FLAGS_SQL, tuple(map(test_run_data.get, LATEST_FLAGS_KEYS)))
 
-        self.connection.commit()
+        if commit:
+            self.connection.commit()
         log_info(
             f"Updated {cursor.rowcount} existing tests to is_latest=0",
             {"unique_key": unique_key},
@@ -627,6 +836,18 @@ def get_db() -> sqlite3.Connection:
     return db_manager.connection
 
 
+def get_db_ro() -> Iterator[sqlite3.Connection]:
+    """Get a pooled read-only database connection (FastAPI dependency for GET endpoints)"""
+    try:
+        connection = db_manager.acquire_reader()
+    except queue.Empty:
+        raise HTTPException(status_code=503, detail="Database busy, please retry")
+    try:
+        yield connection
+    finally:
+        db_manager.release_reader(connection)
+
+
 @asynccontextmanager
 async def get_db_cursor():
     """Get database cursor context manager"""
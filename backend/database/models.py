@@ -4,7 +4,7 @@ from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, TypedDict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestRunBase:
     """Base test run model"""
 
@@ -49,7 +49,7 @@ class TestRunBase:
     is_latest: int = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestRun(TestRunBase):
     """Test run model with ID"""
 
@@ -76,7 +76,7 @@ class BulkUpdateRequest:
     updates: TestRunUpdate
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceMetric:
     """Performance metric model"""
 
@@ -100,7 +100,7 @@ class ServerInfo:
     first_test_time: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrendData:
     """Trend data model"""
 
@@ -149,11 +149,18 @@ class ErrorResponse(TypedDict):
     request_id: Optional[str]
 
 
+# Field names of TestRun, computed once at import
+_TEST_RUN_FIELDS = tuple(TestRun.__dataclass_fields__)
+_TEST_RUN_FIELD_SET = frozenset(_TEST_RUN_FIELDS)
+
+
 # Helper functions for dataclass conversion
 def dataclass_to_dict(obj) -> Dict[str, Any]:
     """Convert dataclass to dictionary"""
+    if type(obj) is TestRun:
+        # TestRun is flat, so a shallow copy of its fields matches asdict() without the deep copy
+        return {name: getattr(obj, name) for name in _TEST_RUN_FIELDS}
     if hasattr(obj, "__dataclass_fields__"):
-
         return asdict(obj)
     return obj
 
@@ -161,6 +168,5 @@ def dataclass_to_dict(obj) -> Dict[str, Any]:
 def dict_to_test_run(data: Dict[str, Any]) -> TestRun:
     """Convert dictionary to TestRun dataclass"""
     # Filter out None values and unknown fields
-    known_fields = {f.name for f in TestRun.__dataclass_fields__.values()}
-    filtered_data = {k: v for k, v in data.items() if k in known_fields and v is not None}
+    filtered_data = {k: v for k, v in data.items() if k in _TEST_RUN_FIELD_SET and v is not None}
     return TestRun(**filtered_data)
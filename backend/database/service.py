@@ -101,17 +101,16 @@ class DatabaseService:
 
     @contextmanager
     def get_connection(self):
-        """Get database connection with proper error handling"""
-        conn = None
+        """Get the shared database connection with proper error handling
+
+        The connection is owned by the DatabaseManager and stays open for the
+        lifetime of the application; it is closed by close_database() on shutdown.
+        """
         try:
-            conn = get_db()
-            yield conn
+            yield get_db()
         except sqlite3.Error as e:
             log_error("Database connection error", e)
             raise DatabaseError(f"Database connection failed: {e}")
-        finally:
-            if conn:
-                conn.close()
 
     def execute_query(
         self,
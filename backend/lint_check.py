@@ -5,98 +5,91 @@ This script catches import errors, syntax issues, and code quality problems.
 """
 
 import ast
+import builtins
 import importlib.util
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+# __builtins__ is a module (not a dict) when this file runs as a script, so use a real set
+_BUILTINS = frozenset(dir(builtins))
 
-def check_imports(file_path: str) -> Tuple[bool, List[str]]:
-    """Check if all imports in a file can be resolved"""
-    errors = []
+# Common undefined names we should catch
+_MISSING_IMPORT_NAMES = frozenset(["Depends", "Query", "HTTPException", "File", "UploadFile"])
 
-    try:
-        with open(file_path, "r") as f:
-            content = f.read()
+_SKIP_DIRS = frozenset(["venv", "__pycache__", ".git"])
 
-        # Parse the AST to find imports
-        tree = ast.parse(content)
 
-        # Extract all imports
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for alias in node.names:
-                    if alias.name == "*":
-                        imports.append(module)
-                    else:
-                        imports.append(f"{module}.{alias.name}" if module else alias.name)
-
-        # Check each import
-        for imp in imports:
-            try:
-                # Try relative imports first (for local modules)
-                if imp.startswith("."):
-                    continue  # Skip relative imports for now
-
-                # Check if it's a local module
-                base_module = imp.split(".")[0]
-                if base_module in ["auth", "database", "routers", "utils", "config"]:
-                    # Local module - check if file exists
-                    local_path = Path(base_module)
-                    if not (local_path.exists() or (local_path.parent / f"{base_module}.py").exists()):
-                        errors.append(f"Local module '{base_module}' not found")
-                else:
-                    # External module - try to import
-                    spec = importlib.util.find_spec(base_module)
-                    if spec is None:
-                        errors.append(f"Module '{base_module}' not found")
-
-            except Exception as e:
-                errors.append(f"Error checking import '{imp}': {e}")
+def check_imports(tree: ast.AST) -> Tuple[bool, List[str]]:
+    """Check if all imports in a parsed file can be resolved"""
+    errors = []
 
-    except Exception as e:
-        errors.append(f"Failed to parse file: {e}")
+    # Extract all imports
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            for alias in node.names:
+                if alias.name == "*":
+                    imports.append(module)
+                else:
+                    imports.append(f"{module}.{alias.name}" if module else alias.name)
+
+    # Check each import
+    for imp in imports:
+        try:
+            # Try relative imports first (for local modules)
+            if imp.startswith("."):
+                continue  # Skip relative imports for now
+
+            # Check if it's a local module
+            base_module = imp.split(".")[0]
+            if base_module in ["auth", "database", "routers", "utils", "config"]:
+                # Local module - check if file exists
+                local_path = Path(base_module)
+                if not (local_path.exists() or (local_path.parent / f"{base_module}.py").exists()):
+                    errors.append(f"Local module '{base_module}' not found")
+            else:
+                # External module - try to import
+                spec = importlib.util.find_spec(base_module)
+                if spec is None:
+                    errors.append(f"Module '{base_module}' not found")
+
+        except Exception as e:
+            errors.append(f"Error checking import '{imp}': {e}")
 
     return len(errors) == 0, errors
 
 
-def check_syntax(file_path: str) -> Tuple[bool, List[str]]:
-    """Check syntax of a Python file"""
+def parse_file(file_path: str) -> Tuple[Optional[ast.AST], List[str]]:
+    """Parse a Python file once; a syntax error is reported instead of a tree"""
     errors = []
 
     try:
-        with open(file_path, "r") as f:
-            content = f.read()
-
-        # Compile to check syntax
-        compile(content, file_path, "exec")
+        # The parser takes bytes directly and honours any coding declaration
+        return ast.parse(Path(file_path).read_bytes(), file_path), errors
 
     except SyntaxError as e:
         errors.append(f"Syntax error at line {e.lineno}: {e.msg}")
     except Exception as e:
         errors.append(f"Error checking syntax: {e}")
 
-    return len(errors) == 0, errors
+    return None, errors
 
 
-def check_undefined_names(file_path: str) -> Tuple[bool, List[str]]:
+def check_undefined_names(tree: ast.AST) -> Tuple[bool, List[str]]:
     """Check for undefined names (like our Depends issue)"""
     errors = []
 
     try:
-        with open(file_path, "r") as f:
-            content = f.read()
-
-        tree = ast.parse(content)
-
         # Collect all defined names
         defined_names = set()
         imported_names = set()
+        loaded_names = []
 
         for node in ast.walk(tree):
             # Function and class definitions
@@ -120,21 +113,17 @@ def check_undefined_names(file_path: str) -> Tuple[bool, List[str]]:
                     name = alias.asname if alias.asname else alias.name
                     imported_names.add(name)
 
+            # Name usages, checked once every definition has been seen
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+                loaded_names.append(node.id)
+
         # Check for undefined names in function calls and usage
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                name = node.id
-                if name not in defined_names and name not in imported_names and name not in __builtins__ and not name.startswith("_"):  # Skip private/magic names
-
-                    # Common undefined names we should catch
-                    if name in [
-                        "Depends",
-                        "Query",
-                        "HTTPException",
-                        "File",
-                        "UploadFile",
-                    ]:
-                        errors.append(f"Undefined name '{name}' - likely missing import")
+        for name in loaded_names:
+            if name not in defined_names and name not in imported_names and name not in _BUILTINS and not name.startswith("_"):  # Skip private/magic names
+
+                # Common undefined names we should catch
+                if name in _MISSING_IMPORT_NAMES:
+                    errors.append(f"Undefined name '{name}' - likely missing import")
 
     except Exception as e:
         errors.append(f"Error checking undefined names: {e}")
@@ -143,9 +132,7 @@ def check_undefined_names(file_path: str) -> Tuple[bool, List[str]]:
 
 
 def lint_file(file_path: str) -> Dict[str, any]:
-    """Run comprehensive lint checks on a file"""
-    print(f"🔍 Linting {file_path}...")
-
+    """Run comprehensive lint checks on a file (parsed once for all checks)"""
     results = {
         "file": file_path,
         "syntax_ok": True,
@@ -156,25 +143,31 @@ def lint_file(file_path: str) -> Dict[str, any]:
     }
 
     # Check syntax
-    syntax_ok, syntax_errors = check_syntax(file_path)
-    results["syntax_ok"] = syntax_ok
+    tree, syntax_errors = parse_file(file_path)
+    results["syntax_ok"] = tree is not None
     if syntax_errors:
         results["errors"].extend([f"SYNTAX: {e}" for e in syntax_errors])
 
     # Check imports (only if syntax is OK)
-    if syntax_ok:
-        imports_ok, import_errors = check_imports(file_path)
+    if tree is not None:
+        imports_ok, import_errors = check_imports(tree)
         results["imports_ok"] = imports_ok
         if import_errors:
             results["errors"].extend([f"IMPORT: {e}" for e in import_errors])
 
         # Check undefined names
-        undefined_ok, undefined_errors = check_undefined_names(file_path)
+        undefined_ok, undefined_errors = check_undefined_names(tree)
         results["undefined_ok"] = undefined_ok
         if undefined_errors:
             results["errors"].extend([f"UNDEFINED: {e}" for e in undefined_errors])
 
-    # Print results
+    return results
+
+
+def print_result(results: Dict[str, any]):
+    """Print the lint results of one file"""
+    print(f"🔍 Linting {results['file']}...")
+
     if results["syntax_ok"] and results["imports_ok"] and results["undefined_ok"]:
         print("  ✅ All checks passed")
     else:
@@ -182,7 +175,16 @@ def lint_file(file_path: str) -> Dict[str, any]:
         for error in results["errors"]:
             print(f"    • {error}")
 
-    return results
+
+def iter_py_files(root: str) -> Iterator[str]:
+    """Yield Python files below root, skipping virtual environment and cache directories"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    yield from iter_py_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
 
 
 def main():
@@ -190,21 +192,14 @@ def main():
     print("🚀 FIO Analyzer Backend Linting Check")
     print("=" * 50)
 
-    # Find all Python files
-    python_files = []
-    for root, dirs, files in os.walk("."):
-        # Skip virtual environment and cache directories
-        dirs[:] = [d for d in dirs if d not in ["venv", "__pycache__", ".git"]]
-        for file in files:
-            if file.endswith(".py"):
-                python_files.append(os.path.join(root, file))
-
-    # Lint each file
+    # Parsing is CPU-bound, so spread it across processes; map keeps the file order
+    # and yields each result as soon as it is ready, so the report streams
     all_results = []
-    for file_path in sorted(python_files):
-        result = lint_file(file_path)
-        all_results.append(result)
-        print()
+    with ProcessPoolExecutor() as executor:
+        for result in executor.map(lint_file, sorted(iter_py_files(".")), chunksize=8):
+            print_result(result)
+            print()
+            all_results.append(result)
 
     # Summary
     total_files = len(all_results)
@@ -4,17 +4,22 @@ FIO Analyzer FastAPI Backend
 A comprehensive API for FIO (Flexible I/O Tester) performance analysis and time-series monitoring.
 """
 
+import itertools
 import logging
 import os
 import signal
+import time
 from contextlib import asynccontextmanager
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from auth.authentication import init_auth_store
 from config.settings import settings
 from database.connection import close_database, init_database
 from routers import imports, test_runs, time_series, users, utils_router
@@ -42,6 +47,12 @@ async def lifespan(app: FastAPI):
     # Initialize database
     await init_database()
 
+    # Load htpasswd users once; the store reloads them when the files change
+    app.state.auth_store = init_auth_store()
+
+    # Build the OpenAPI schema now rather than on the first /docs or /openapi.json hit
+    app.openapi()
+
     yield
 
     # Shutdown
@@ -123,72 +134,100 @@ For detailed examples and testing, visit the interactive documentation below.
             "description": "User account and authentication management (admin only)",
         },
     ],
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-# Add request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests"""
-    import time
-    import uuid
+# Add CORS middleware (skipped entirely when the frontend is served from the same origin)
+if settings.cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        # Auth is an explicit Authorization header, not cookies; credentials never pair with "*"
+        allow_credentials="*" not in settings.cors_origins,
+        allow_methods=["GET", "POST", "PUT", "DELETE"],
+        allow_headers=["*"],
+    )
 
-    # Generate request ID
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
 
-    start_time = time.time()
+class RequestLoggingMiddleware:
+    """Log all incoming requests and tag responses with an X-Request-ID header
 
-    log_info(
-        "Request started",
-        {
-            "request_id": request_id,
-            "method": request.method,
-            "url": str(request.url),
-            "client_ip": request.client.host if request.client else "unknown",
-            "user_agent": request.headers.get("user-agent", "unknown"),
-        },
-    )
-
-    try:
-        response = await call_next(request)
+    A pure ASGI middleware: @app.middleware("http") runs on BaseHTTPMiddleware,
+    which sets up a task group and memory streams per request just to observe it.
+    """
 
-        process_time = time.time() - start_time
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Request IDs only correlate log lines, so pid + start time + a counter is unique
+        # enough and avoids an os.urandom() call per request. The middleware stack is built
+        # on the first request, so this runs in the worker process that serves it.
+        self._request_id_prefix = f"{os.getpid():x}-{int(time.time()):x}-"
+        self._request_ids = itertools.count(1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate request ID
+        request_id = f"{self._request_id_prefix}{next(self._request_ids):x}"
+        start_time = time.monotonic()
+
+        # request.state in the handlers reads this dict
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["started_at"] = start_time
+
+        status_code = None
+        request_id_header = (b"x-request-id", request_id.encode())
+
+        async def send_with_request_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except Exception as e:
+            process_time = time.monotonic() - start_time
+            log_error(
+                "Request failed",
+                e,
+                {
+                    "request_id": request_id,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "process_time": f"{process_time:.4f}s",
+                },
+            )
+            raise
+
+        # One record per request, written once the response has been sent
+        process_time = time.monotonic() - start_time
+        request = Request(scope)
         log_info(
             "Request completed",
             {
                 "request_id": request_id,
-                "status_code": response.status_code,
+                "method": request.method,
+                "url": str(request.url),
+                "status_code": status_code,
                 "process_time": f"{process_time:.4f}s",
+                "client_ip": request.client.host if request.client else "unknown",
+                "user_agent": request.headers.get("user-agent", "unknown"),
             },
         )
 
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
 
-        return response
-
-    except Exception as e:
-        process_time = time.time() - start_time
-        log_error(
-            "Request failed",
-            e,
-            {"request_id": request_id, "process_time": f"{process_time:.4f}s"},
-        )
-        raise
+# Add request logging middleware
+app.add_middleware(RequestLoggingMiddleware)
 
 
 # Include routers with descriptive tags
@@ -242,6 +281,17 @@ app.include_router(
 )
 
 
+# Static response bodies for the high-traffic health check and auth failures
+_HEALTH_JSON = orjson.dumps(
+    {
+        "status": "OK",
+        "timestamp": "2025-06-31T20:00:00Z",
+        "version": settings.version,
+    }
+)
+_ERROR_JSON = {detail: orjson.dumps({"error": detail}) for detail in ("Authentication required", "Admin access required", "Upload access required")}
+
+
 # Health check endpoint
 @app.get(
     "/health",
@@ -280,11 +330,7 @@ async def health_check():
     - Service availability verification
     - API status validation
     """
-    return {
-        "status": "OK",
-        "timestamp": "2025-06-31T20:00:00Z",
-        "version": settings.version,
-    }
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 
 # Error handlers
@@ -303,7 +349,9 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         },
     )
 
-    return JSONResponse(status_code=exc.status_code, content={"error": str(exc.detail)})
+    detail = str(exc.detail)
+    body = _ERROR_JSON.get(detail) or orjson.dumps({"error": detail})
+    return Response(body, status_code=exc.status_code, media_type="application/json")
 
 
 @app.exception_handler(RequestValidationError)
@@ -332,7 +380,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         },
     )
 
-    return JSONResponse(status_code=400, content={"error": error_message})
+    return ORJSONResponse(status_code=400, content={"error": error_message})
 
 
 @app.exception_handler(Exception)
@@ -346,7 +394,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         {"request_id": request_id, "method": request.method, "url": str(request.url)},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal server error", "request_id": request_id},
     )
@@ -364,11 +412,16 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Run the application
+    # Run the application; loop/http "auto" pick uvloop and httptools when installed (uvicorn[standard])
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=settings.port,
         reload=False,
+        workers=settings.workers,
+        loop="auto",
+        http="auto",
         access_log=False,  # We handle logging ourselves
+        server_header=False,
+        date_header=False,
     )
@@ -4,12 +4,14 @@ Import API router
 
 import hashlib
 import json
+import shutil
 import sqlite3
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional
 
+import orjson
 from fastapi import (
     APIRouter,
     Body,
@@ -21,14 +23,125 @@ from fastapi import (
     UploadFile,
 )
 
-# Removed ImportResponse import - using plain dictionaries
+# Response models document the OpenAPI schema only; the handlers return plain dictionaries
+from api_models import BulkImportResponse
 from auth.middleware import User, require_admin, require_uploader
 from config.settings import settings
-from database.connection import db_manager, get_db
+from database.connection import db_manager, get_db, insert_statement
 from utils.logging import log_error, log_info
 
 router = APIRouter()
 
+# Buffer size used when copying an upload from its spooled temporary file to the uploads directory
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Latency percentiles extracted on import: column name and FIO's percentile key (e.g. "99.500000")
+LATENCY_PERCENTILES = tuple(
+    (f"p{str(percentile).replace('.', '_')}_latency", f"{percentile:.6f}")
+    for percentile in (1, 5, 10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 99, 99.5, 99.9, 99.95, 99.99)
+)
+
+# Columns written by insert_test_run (both tables) and insert_saturation_run
+TEST_RUN_COLUMNS = (
+    "timestamp",
+    "test_date",
+    "drive_model",
+    "drive_type",
+    "test_name",
+    "block_size",
+    "read_write_pattern",
+    "queue_depth",
+    "duration",
+    "fio_version",
+    "job_runtime",
+    "rwmixread",
+    "total_ios_read",
+    "total_ios_write",
+    "usr_cpu",
+    "sys_cpu",
+    "hostname",
+    "protocol",
+    "description",
+    "config_uuid",
+    "run_uuid",
+    "output_file",
+    "num_jobs",
+    "direct",
+    "test_size",
+    "sync",
+    "iodepth",
+    "avg_latency",
+    "bandwidth",
+    "iops",
+    "p1_latency",
+    "p5_latency",
+    "p10_latency",
+    "p20_latency",
+    "p30_latency",
+    "p40_latency",
+    "p50_latency",
+    "p60_latency",
+    "p70_latency",
+    "p80_latency",
+    "p90_latency",
+    "p95_latency",
+    "p99_latency",
+    "p99_5_latency",
+    "p99_9_latency",
+    "p99_95_latency",
+    "p99_99_latency",
+    "is_latest",
+)
+SATURATION_RUN_COLUMNS = (
+    "timestamp",
+    "test_date",
+    "drive_model",
+    "drive_type",
+    "test_name",
+    "block_size",
+    "read_write_pattern",
+    "queue_depth",
+    "duration",
+    "fio_version",
+    "job_runtime",
+    "rwmixread",
+    "total_ios_read",
+    "total_ios_write",
+    "usr_cpu",
+    "sys_cpu",
+    "hostname",
+    "protocol",
+    "description",
+    "config_uuid",
+    "run_uuid",
+    "output_file",
+    "num_jobs",
+    "direct",
+    "test_size",
+    "sync",
+    "iodepth",
+    "avg_latency",
+    "bandwidth",
+    "iops",
+    "p1_latency",
+    "p5_latency",
+    "p10_latency",
+    "p20_latency",
+    "p30_latency",
+    "p40_latency",
+    "p50_latency",
+    "p60_latency",
+    "p70_latency",
+    "p80_latency",
+    "p90_latency",
+    "p95_latency",
+    "p99_latency",
+    "p99_5_latency",
+    "p99_9_latency",
+    "p99_95_latency",
+    "p99_99_latency",
+)
+
 
 def generate_uuid_from_hash(input_string: str) -> str:
     """
@@ -198,15 +311,16 @@ async def import_fio_data(
         if file.size and file.size > settings.max_upload_size:
             raise HTTPException(status_code=400, detail="File too large")
 
-        # Read and parse JSON
-        content = await file.read()
+        # Read and parse JSON; the upload stays spooled in file.file, so neither the raw bytes
+        # nor the parsed document need to be kept around once the test run data is extracted
         try:
-            fio_data = json.loads(content.decode("utf-8"))
-        except json.JSONDecodeError as e:
+            fio_data = orjson.loads(await file.read())
+        except orjson.JSONDecodeError as e:
             raise HTTPException(status_code=400, detail=f"Invalid JSON format: {str(e)}")
 
         # Extract test run data from FIO JSON
         test_run_data = extract_test_run_data(fio_data, file.filename)
+        del fio_data
 
         # Override with form data
         test_run_data.update(
@@ -250,7 +364,8 @@ async def import_fio_data(
             test_run_data["run_uuid"] = generate_uuid_from_hash(hash_seed)
 
         # Save uploaded file
-        file_path = save_uploaded_file(content, file.filename, test_run_data)
+        await file.seek(0)
+        file_path = save_uploaded_file(file.file, file.filename, test_run_data)
 
         # Create metadata file (matching Node.js behavior)
         create_metadata_file(file_path, test_run_data, user.username, file.filename)
@@ -259,7 +374,8 @@ async def import_fio_data(
         if is_saturation_run(description):
             test_run_id = insert_saturation_run(db, test_run_data, file_path)
         else:
-            await db_manager.update_latest_flags(test_run_data)
+            # insert_test_run commits the flag update and the new row together
+            await db_manager.update_latest_flags(test_run_data, commit=False)
             test_run_id = insert_test_run(db, test_run_data, file_path)
 
         log_info(
@@ -285,6 +401,7 @@ async def import_fio_data(
     except HTTPException:
         raise
     except Exception as e:
+        db.rollback()
         log_error("Error importing FIO data", e, {"request_id": request_id})
         raise HTTPException(status_code=500, detail="Failed to import FIO data")
 
@@ -296,6 +413,7 @@ async def import_fio_data(
     response_description="Bulk import operation statistics and results",
     responses={
         200: {
+            "model": BulkImportResponse,
             "description": "Bulk import completed with statistics",
             "content": {
                 "application/json": {
@@ -434,19 +552,24 @@ async def bulk_import_fio_data(
         error_files = 0
         dry_run_results = []
 
+        if not dry_run and not db.in_transaction:
+            # One write transaction (and one commit) for the whole import; each file runs in its
+            # own savepoint so a failing file only undoes its own rows
+            db.execute("BEGIN IMMEDIATE")
+
         for json_file in json_files:
+            if not dry_run:
+                db.execute("SAVEPOINT bulk_file")
             try:
                 # Read and parse JSON file
-                with open(json_file, "r", encoding="utf-8") as f:
-                    fio_data = json.load(f)
+                fio_data = orjson.loads(json_file.read_bytes())
 
                 # Try to read metadata from .info file first
                 info_file = json_file.with_suffix(".info")
                 metadata = {}
                 if info_file.exists():
                     try:
-                        with open(info_file, "r", encoding="utf-8") as f:
-                            metadata = json.load(f)
+                        metadata = orjson.loads(info_file.read_bytes())
                     except Exception as e:
                         log_error(
                             f"Error reading .info file {info_file}",
@@ -540,16 +663,24 @@ async def bulk_import_fio_data(
                         continue
 
                     if is_saturation:
-                        insert_saturation_run(db, test_run_data, str(json_file))
+                        insert_saturation_run(db, test_run_data, str(json_file), commit=False)
                     else:
-                        await db_manager.update_latest_flags(test_run_data)
-                        insert_test_run(db, test_run_data, str(json_file))
+                        await db_manager.update_latest_flags(test_run_data, commit=False)
+                        insert_test_run(db, test_run_data, str(json_file), commit=False)
                     total_test_runs += 1
                     processed_files += 1
 
             except Exception as e:
+                if not dry_run:
+                    db.execute("ROLLBACK TO bulk_file")
                 log_error(f"Error processing file {json_file}", e, {"request_id": request_id})
                 error_files += 1
+            finally:
+                if not dry_run:
+                    db.execute("RELEASE bulk_file")
+
+        if not dry_run:
+            db.commit()
 
         log_info(
             "Bulk import completed",
@@ -583,6 +714,7 @@ async def bulk_import_fio_data(
     except HTTPException:
         raise
     except Exception as e:
+        db.rollback()
         log_error("Error during bulk import", e, {"request_id": request_id})
         raise HTTPException(status_code=500, detail="Failed to perform bulk import")
 
@@ -702,23 +834,7 @@ def extract_test_run_data(fio_data: Dict[str, Any], filename: str) -> Dict[str,
         "avg_latency": extract_latency(job),
         "bandwidth": extract_bandwidth(job),
         # Extract all latency percentiles
-        "p1_latency": extract_percentile_latency(job, 1),
-        "p5_latency": extract_percentile_latency(job, 5),
-        "p10_latency": extract_percentile_latency(job, 10),
-        "p20_latency": extract_percentile_latency(job, 20),
-        "p30_latency": extract_percentile_latency(job, 30),
-        "p40_latency": extract_percentile_latency(job, 40),
-        "p50_latency": extract_percentile_latency(job, 50),
-        "p60_latency": extract_percentile_latency(job, 60),
-        "p70_latency": extract_percentile_latency(job, 70),
-        "p80_latency": extract_percentile_latency(job, 80),
-        "p90_latency": extract_percentile_latency(job, 90),
-        "p95_latency": extract_percentile_latency(job, 95),
-        "p99_latency": extract_percentile_latency(job, 99),
-        "p99_5_latency": extract_percentile_latency(job, 99.5),
-        "p99_9_latency": extract_percentile_latency(job, 99.9),
-        "p99_95_latency": extract_percentile_latency(job, 99.95),
-        "p99_99_latency": extract_percentile_latency(job, 99.99),
+        **extract_percentile_latencies(job),
         # Extract system info
         "usr_cpu": fio_data.get("usr_cpu", 0),
         "sys_cpu": fio_data.get("sys_cpu", 0),
@@ -814,33 +930,32 @@ def extract_bandwidth(job: Dict[str, Any]) -> float:
     return (read_bw + write_bw) / (1024 * 1024)  # Convert to MB/s
 
 
-def extract_percentile_latency(job: Dict[str, Any], percentile: float) -> float:
+def extract_percentile_latencies(job: Dict[str, Any]) -> Dict[str, float]:
     """
-    Extract percentile latency statistics from FIO job data.
+    Extract all stored percentile latency statistics from FIO job data.
 
-    Retrieves the specified percentile latency value (P1, P5, P95, P99, etc.)
+    Retrieves every percentile in LATENCY_PERCENTILES (P1, P5, ..., P99.99)
     and converts from nanoseconds to milliseconds. Uses the higher
     value between read and write operations.
 
     Args:
         job: FIO job data containing latency percentile statistics
-        percentile: Percentile value to extract (e.g., 95 for P95, 99.5 for P99.5)
 
     Returns:
-        Percentile latency in milliseconds
+        Percentile latencies in milliseconds, keyed by column name (e.g. "p99_5_latency")
     """
-    # Format percentile key to match FIO format (e.g., "1.000000", "99.500000")
-    percentile_key = f"{percentile:.6f}"
-    
-    read_lat = job.get("read", {}).get("clat_ns", {}).get("percentile", {}).get(percentile_key, 0)
-    write_lat = job.get("write", {}).get("clat_ns", {}).get("percentile", {}).get(percentile_key, 0)
+    # Look the percentile tables up once rather than once per percentile
+    read_percentiles = job.get("read", {}).get("clat_ns", {}).get("percentile", {})
+    write_percentiles = job.get("write", {}).get("clat_ns", {}).get("percentile", {})
 
     # Use the higher of read/write latency
-    max_lat = max(read_lat, write_lat)
-    return max_lat / 1000000  # Convert ns to ms
+    return {
+        column: max(read_percentiles.get(key, 0), write_percentiles.get(key, 0)) / 1000000  # Convert ns to ms
+        for column, key in LATENCY_PERCENTILES
+    }
 
 
-def insert_test_run(db: sqlite3.Connection, test_run_data: Dict[str, Any], file_path: str = None) -> int:
+def insert_test_run(db: sqlite3.Connection, test_run_data: Dict[str, Any], file_path: str = None, commit: bool = True) -> int:
     """
     Insert test run data into both current and historical database tables.
 
@@ -851,79 +966,21 @@ def insert_test_run(db: sqlite3.Connection, test_run_data: Dict[str, Any], file_
         db: Database connection
         test_run_data: Complete test run data dictionary
         file_path: Optional path to the source JSON file
+        commit: Commit right away; pass False to leave the rows in the caller's transaction
 
     Returns:
         ID of the inserted test run from the test_runs table
     """
     cursor = db.cursor()
 
-    # Define columns and values
-    columns = [
-        "timestamp",
-        "test_date",
-        "drive_model",
-        "drive_type",
-        "test_name",
-        "block_size",
-        "read_write_pattern",
-        "queue_depth",
-        "duration",
-        "fio_version",
-        "job_runtime",
-        "rwmixread",
-        "total_ios_read",
-        "total_ios_write",
-        "usr_cpu",
-        "sys_cpu",
-        "hostname",
-        "protocol",
-        "description",
-        "config_uuid",
-        "run_uuid",
-        "output_file",
-        "num_jobs",
-        "direct",
-        "test_size",
-        "sync",
-        "iodepth",
-        "avg_latency",
-        "bandwidth",
-        "iops",
-        "p1_latency",
-        "p5_latency",
-        "p10_latency",
-        "p20_latency",
-        "p30_latency",
-        "p40_latency",
-        "p50_latency",
-        "p60_latency",
-        "p70_latency",
-        "p80_latency",
-        "p90_latency",
-        "p95_latency",
-        "p99_latency",
-        "p99_5_latency",
-        "p99_9_latency",
-        "p99_95_latency",
-        "p99_99_latency",
-        "is_latest",
-    ]
-
-    values = [test_run_data.get(col) for col in columns]
-    placeholders = ", ".join(["?" for _ in columns])
+    values = tuple(map(test_run_data.get, TEST_RUN_COLUMNS))
 
     # Insert into test_runs_all first
-    cursor.execute(
-        f"INSERT INTO test_runs_all ({', '.join(columns)}) VALUES ({placeholders})",
-        values,
-    )
+    cursor.execute(insert_statement("test_runs_all", TEST_RUN_COLUMNS), values)
     test_run_all_id = cursor.lastrowid
 
     # Insert into test_runs (with conflict resolution)
-    cursor.execute(
-        f"INSERT OR REPLACE INTO test_runs ({', '.join(columns)}) VALUES ({placeholders})",
-        values,
-    )
+    cursor.execute(insert_statement("test_runs", TEST_RUN_COLUMNS, "INSERT OR REPLACE"), values)
     test_run_id = cursor.lastrowid
 
     # Update file path in both tables if provided
@@ -937,11 +994,12 @@ def insert_test_run(db: sqlite3.Connection, test_run_data: Dict[str, Any], file_
             (str(file_path), test_run_all_id),
         )
 
-    db.commit()
+    if commit:
+        db.commit()
     return test_run_id
 
 
-def insert_saturation_run(db: sqlite3.Connection, test_run_data: Dict[str, Any], file_path: str = None) -> int:
+def insert_saturation_run(db: sqlite3.Connection, test_run_data: Dict[str, Any], file_path: str = None, commit: bool = True) -> int:
     """
     Insert a saturation test run into the dedicated saturation_runs table.
 
@@ -952,69 +1010,16 @@ def insert_saturation_run(db: sqlite3.Connection, test_run_data: Dict[str, Any],
         db: Database connection
         test_run_data: Complete test run data dictionary
         file_path: Optional path to the source JSON file
+        commit: Commit right away; pass False to leave the row in the caller's transaction
 
     Returns:
         ID of the inserted saturation run
     """
     cursor = db.cursor()
 
-    columns = [
-        "timestamp",
-        "test_date",
-        "drive_model",
-        "drive_type",
-        "test_name",
-        "block_size",
-        "read_write_pattern",
-        "queue_depth",
-        "duration",
-        "fio_version",
-        "job_runtime",
-        "rwmixread",
-        "total_ios_read",
-        "total_ios_write",
-        "usr_cpu",
-        "sys_cpu",
-        "hostname",
-        "protocol",
-        "description",
-        "config_uuid",
-        "run_uuid",
-        "output_file",
-        "num_jobs",
-        "direct",
-        "test_size",
-        "sync",
-        "iodepth",
-        "avg_latency",
-        "bandwidth",
-        "iops",
-        "p1_latency",
-        "p5_latency",
-        "p10_latency",
-        "p20_latency",
-        "p30_latency",
-        "p40_latency",
-        "p50_latency",
-        "p60_latency",
-        "p70_latency",
-        "p80_latency",
-        "p90_latency",
-        "p95_latency",
-        "p99_latency",
-        "p99_5_latency",
-        "p99_9_latency",
-        "p99_95_latency",
-        "p99_99_latency",
-    ]
-
-    values = [test_run_data.get(col) for col in columns]
-    placeholders = ", ".join(["?" for _ in columns])
-
-    cursor.execute(
-        f"INSERT INTO saturation_runs ({', '.join(columns)}) VALUES ({placeholders})",
-        values,
-    )
+    values = tuple(map(test_run_data.get, SATURATION_RUN_COLUMNS))
+
+    cursor.execute(insert_statement("saturation_runs", SATURATION_RUN_COLUMNS), values)
     run_id = cursor.lastrowid
 
     if file_path:
@@ -1023,11 +1028,12 @@ def insert_saturation_run(db: sqlite3.Connection, test_run_data: Dict[str, Any],
             (str(file_path), run_id),
         )
 
-    db.commit()
+    if commit:
+        db.commit()
     return run_id
 
 
-def save_uploaded_file(content: bytes, filename: str, test_run_data: Dict[str, Any]) -> str:
+def save_uploaded_file(source: BinaryIO, filename: str, test_run_data: Dict[str, Any]) -> str:
     """
     Save uploaded file to organized directory structure on disk.
 
@@ -1037,7 +1043,7 @@ def save_uploaded_file(content: bytes, filename: str, test_run_data: Dict[str, A
     Directory structure: uploads/hostname/protocol/YYYY-MM-DD/HH-MM/
 
     Args:
-        content: Raw file content bytes
+        source: Binary file object positioned at the start of the upload
         filename: Original filename
         test_run_data: Test metadata for directory organization
 
@@ -1058,8 +1064,9 @@ def save_uploaded_file(content: bytes, filename: str, test_run_data: Dict[str, A
     unique_filename = f"{uuid.uuid4().hex}_{filename}"
     file_path = dir_path / unique_filename
 
+    # Copy in chunks straight from the spooled upload instead of materializing it as bytes
     with open(file_path, "wb") as f:
-        f.write(content)
+        shutil.copyfileobj(source, f, UPLOAD_COPY_CHUNK_SIZE)
 
     return str(file_path)
 
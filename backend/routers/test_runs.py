@@ -6,6 +6,7 @@ import sqlite3
 from dataclasses import asdict
 from typing import Optional
 
+import orjson
 from fastapi import (
     APIRouter,
     Body,
@@ -15,14 +16,52 @@ from fastapi import (
     Query,
     Request,
 )
+from fastapi.responses import ORJSONResponse
 
 from auth.middleware import User, require_admin
-from database.connection import get_db
+from database.connection import get_db, get_db_ro
 from database.models import BulkUpdateRequest
 from utils.logging import log_error, log_info
 
 router = APIRouter()
 
+# Metrics reported by /performance-data, in response order
+PERFORMANCE_METRICS = (
+    ("avg_latency", "ms"),
+    ("bandwidth", "MB/s"),
+    ("iops", "IOPS"),
+    ("p70_latency", "ms"),
+    ("p90_latency", "ms"),
+    ("p95_latency", "ms"),
+    ("p99_latency", "ms"),
+)
+
+# Filter lists longer than this are bound as one json_each() parameter instead of inline placeholders
+MAX_INLINE_IN_VALUES = 8
+
+# Columns /performance-data reads, for every requested run at once
+PERFORMANCE_DATA_SQL = (
+    "SELECT id, timestamp, drive_model, drive_type, test_name, description, block_size, "
+    "read_write_pattern, queue_depth, duration, hostname, protocol, output_file, num_jobs, "
+    "direct, test_size, sync, iodepth, config_uuid, run_uuid, "
+    + ", ".join(metric for metric, _ in PERFORMANCE_METRICS)
+    + " FROM test_runs WHERE id IN (SELECT value FROM json_each(?))"
+)
+
+
+def _in_condition(column: str, values: list, params: list) -> str:
+    """`column IN (...)` for a filter list, appending its parameters to params
+
+    Lists longer than MAX_INLINE_IN_VALUES are bound as a single JSON array, so long
+    selections neither need one placeholder per value nor produce a new statement text
+    for every list length.
+    """
+    if len(values) > MAX_INLINE_IN_VALUES:
+        params.append(orjson.dumps(values).decode())
+        return f"{column} IN (SELECT value FROM json_each(?))"
+    params.extend(values)
+    return f"{column} IN ({','.join('?' * len(values))})"
+
 
 @router.get(
     "/",
@@ -59,7 +98,7 @@ router = APIRouter()
     },
 )
 @router.get("", include_in_schema=False)  # Handle route without trailing slash but hide from docs
-async def get_test_runs(
+def get_test_runs(
     request: Request,
     hostnames: Optional[str] = Query(
         None,
@@ -135,7 +174,7 @@ async def get_test_runs(
         example=False,
     ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Retrieve test runs with comprehensive filtering capabilities.
@@ -166,90 +205,57 @@ async def get_test_runs(
         params = []
 
         if hostnames:
-            hostname_list = [h.strip() for h in hostnames.split(",")]
-            placeholders = ",".join(["?" for _ in hostname_list])
-            where_conditions.append(f"hostname IN ({placeholders})")
-            params.extend(hostname_list)
+            where_conditions.append(_in_condition("hostname", [h.strip() for h in hostnames.split(",")], params))
 
         if drive_types:
-            drive_type_list = [d.strip() for d in drive_types.split(",")]
-            placeholders = ",".join(["?" for _ in drive_type_list])
-            where_conditions.append(f"drive_type IN ({placeholders})")
-            params.extend(drive_type_list)
+            where_conditions.append(_in_condition("drive_type", [d.strip() for d in drive_types.split(",")], params))
 
         # ADDED: drive_models filter
         if drive_models:
-            drive_model_list = [d.strip() for d in drive_models.split(",")]
-            placeholders = ",".join(["?" for _ in drive_model_list])
-            where_conditions.append(f"drive_model IN ({placeholders})")
-            params.extend(drive_model_list)
+            where_conditions.append(_in_condition("drive_model", [d.strip() for d in drive_models.split(",")], params))
 
         if protocols:
-            protocol_list = [p.strip() for p in protocols.split(",")]
-            placeholders = ",".join(["?" for _ in protocol_list])
-            where_conditions.append(f"protocol IN ({placeholders})")
-            params.extend(protocol_list)
+            where_conditions.append(_in_condition("protocol", [p.strip() for p in protocols.split(",")], params))
 
         if patterns:
-            pattern_list = [p.strip() for p in patterns.split(",")]
-            placeholders = ",".join(["?" for _ in pattern_list])
-            where_conditions.append(f"read_write_pattern IN ({placeholders})")
-            params.extend(pattern_list)
+            where_conditions.append(_in_condition("read_write_pattern", [p.strip() for p in patterns.split(",")], params))
 
         if block_sizes:
-            block_size_list = [b.strip() for b in block_sizes.split(",")]
-            placeholders = ",".join(["?" for _ in block_size_list])
-            where_conditions.append(f"block_size IN ({placeholders})")
-            params.extend(block_size_list)
+            where_conditions.append(_in_condition("block_size", [b.strip() for b in block_sizes.split(",")], params))
 
         # ADDED: syncs filter (integer conversion)
         if syncs:
-            sync_list = [int(s.strip()) for s in syncs.split(",")]
-            placeholders = ",".join(["?" for _ in sync_list])
-            where_conditions.append(f"sync IN ({placeholders})")
-            params.extend(sync_list)
+            where_conditions.append(_in_condition("sync", list(map(int, syncs.split(","))), params))
 
         # ADDED: queue_depths filter (integer conversion)
         if queue_depths:
-            queue_depth_list = [int(q.strip()) for q in queue_depths.split(",")]
-            placeholders = ",".join(["?" for _ in queue_depth_list])
-            where_conditions.append(f"queue_depth IN ({placeholders})")
-            params.extend(queue_depth_list)
+            where_conditions.append(_in_condition("queue_depth", list(map(int, queue_depths.split(","))), params))
 
         # ADDED: directs filter (integer conversion)
         if directs:
-            direct_list = [int(d.strip()) for d in directs.split(",")]
-            placeholders = ",".join(["?" for _ in direct_list])
-            where_conditions.append(f"direct IN ({placeholders})")
-            params.extend(direct_list)
+            where_conditions.append(_in_condition("direct", list(map(int, directs.split(","))), params))
 
         # ADDED: num_jobs filter (integer conversion)
         if num_jobs:
-            num_jobs_list = [int(n.strip()) for n in num_jobs.split(",")]
-            placeholders = ",".join(["?" for _ in num_jobs_list])
-            where_conditions.append(f"num_jobs IN ({placeholders})")
-            params.extend(num_jobs_list)
+            where_conditions.append(_in_condition("num_jobs", list(map(int, num_jobs.split(","))), params))
 
         # ADDED: test_sizes filter
         if test_sizes:
-            test_size_list = [s.strip() for s in test_sizes.split(",")]
-            placeholders = ",".join(["?" for _ in test_size_list])
-            where_conditions.append(f"test_size IN ({placeholders})")
-            params.extend(test_size_list)
+            where_conditions.append(_in_condition("test_size", [s.strip() for s in test_sizes.split(",")], params))
 
         # ADDED: durations filter (integer conversion)
         if durations:
-            duration_list = [int(d.strip()) for d in durations.split(",")]
-            placeholders = ",".join(["?" for _ in duration_list])
-            where_conditions.append(f"duration IN ({placeholders})")
-            params.extend(duration_list)
+            where_conditions.append(_in_condition("duration", list(map(int, durations.split(","))), params))
 
         where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
 
-        # Get total count
+        # Get total count (only reported with include_metadata, so plain listings skip the extra scan;
+        # a window COUNT(*) OVER () would also defeat the timestamp index's early exit from the sort)
         cursor = db.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM test_runs WHERE {where_clause}", params)
-        total = cursor.fetchone()[0]
+        total = None
+        if include_metadata:
+            cursor.execute(f"SELECT COUNT(*) FROM test_runs WHERE {where_clause}", params)
+            total = cursor.fetchone()[0]
 
         # Get test runs (exclude test_date to match Node.js response format)
         query = f"""
@@ -268,12 +274,10 @@ async def get_test_runs(
         cursor.execute(query, params + [limit, offset])
         rows = cursor.fetchall()
 
-        # Convert to dictionaries
-        test_runs = []
-        for row in rows:
-            test_run_data = dict(row)
-            test_run_data["block_size"] = str(test_run_data["block_size"])  # Ensure string
-            test_runs.append(test_run_data)
+        # Convert to dictionaries (zipping one column tuple is ~3x faster than dict(sqlite3.Row));
+        # block_size needs no str() pass since the column's TEXT affinity already stores it as text
+        columns = tuple(description[0] for description in cursor.description)
+        test_runs = [dict(zip(columns, row)) for row in rows]
 
         log_info(
             "Test runs retrieved successfully",
@@ -293,16 +297,18 @@ async def get_test_runs(
 
         # Return metadata if requested, otherwise return direct array for backward compatibility
         if include_metadata:
-            return {
-                "data": test_runs,
-                "total": total,
-                "limit": limit,
-                "offset": offset,
-                "has_more": (offset + len(test_runs)) < total,
-            }
+            return ORJSONResponse(
+                {
+                    "data": test_runs,
+                    "total": total,
+                    "limit": limit,
+                    "offset": offset,
+                    "has_more": (offset + len(test_runs)) < total,
+                }
+            )
 
         # Frontend expects direct array of test runs, not wrapped object
-        return test_runs
+        return ORJSONResponse(test_runs)
 
     except Exception as e:
         log_error("Error retrieving test runs", e, {"request_id": request_id})
@@ -619,7 +625,7 @@ async def bulk_update_test_runs_by_uuid(
     },
 )
 @router.get("/performance-data/", include_in_schema=False)  # Handle with trailing slash but hide from docs
-async def get_performance_data(
+def get_performance_data(
     request: Request,
     test_run_ids: str = Query(
         ...,
@@ -627,7 +633,7 @@ async def get_performance_data(
         example="1,2,3,15,42",
     ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Retrieve detailed performance metrics for specific test runs.
@@ -654,31 +660,19 @@ async def get_performance_data(
 
     try:
         # Parse parameters
-        test_run_id_list = [int(id.strip()) for id in test_run_ids.split(",")]
+        test_run_id_list = list(map(int, test_run_ids.split(",")))
 
-        # Build query
-        cursor = db.cursor()
+        # Fetch every requested run in one query (the ID list is bound as a single JSON array)
+        cursor = db.execute(PERFORMANCE_DATA_SQL, (orjson.dumps(test_run_id_list).decode(),))
+        columns = tuple(description[0] for description in cursor.description)
+        runs_by_id = {row[0]: dict(zip(columns, row)) for row in cursor}
 
+        # Respond in request order, skipping unknown IDs
         results = []
         for test_run_id in test_run_id_list:
-            cursor.execute(
-                """
-                SELECT id, timestamp, drive_model, drive_type, test_name, description,
-                       block_size, read_write_pattern, queue_depth, duration,
-                       fio_version, job_runtime, rwmixread, total_ios_read,
-                       total_ios_write, usr_cpu, sys_cpu, hostname, protocol,
-                       uploaded_file_path, output_file, num_jobs, direct, test_size, sync, iodepth, is_latest,
-                       avg_latency, bandwidth, iops, p95_latency, p99_latency,
-                       config_uuid, run_uuid
-                FROM test_runs WHERE id = ?
-            """,
-                (test_run_id,),
-            )
-            row = cursor.fetchone()
-
-            if row:
-                test_run_data = dict(row)
+            test_run_data = runs_by_id.get(test_run_id)
 
+            if test_run_data:
                 # Create response matching Node.js format
                 result = {
                     "id": test_run_data["id"],
@@ -702,13 +696,8 @@ async def get_performance_data(
                     "config_uuid": test_run_data["config_uuid"],
                     "run_uuid": test_run_data["run_uuid"],
                     "metrics": {
-                        "avg_latency": ({"value": test_run_data["avg_latency"], "unit": "ms"} if test_run_data["avg_latency"] is not None else None),
-                        "bandwidth": ({"value": test_run_data["bandwidth"], "unit": "MB/s"} if test_run_data["bandwidth"] is not None else None),
-                        "iops": ({"value": test_run_data["iops"], "unit": "IOPS"} if test_run_data["iops"] is not None else None),
-                        "p70_latency": ({"value": test_run_data["p70_latency"], "unit": "ms"} if test_run_data["p70_latency"] is not None else None),
-                        "p90_latency": ({"value": test_run_data["p90_latency"], "unit": "ms"} if test_run_data["p90_latency"] is not None else None),
-                        "p95_latency": ({"value": test_run_data["p95_latency"], "unit": "ms"} if test_run_data["p95_latency"] is not None else None),
-                        "p99_latency": ({"value": test_run_data["p99_latency"], "unit": "ms"} if test_run_data["p99_latency"] is not None else None),
+                        metric: {"value": test_run_data[metric], "unit": unit} if test_run_data[metric] is not None else None
+                        for metric, unit in PERFORMANCE_METRICS
                     },
                 }
 
@@ -723,7 +712,7 @@ async def get_performance_data(
             },
         )
 
-        return results
+        return ORJSONResponse(results)
 
     except Exception as e:
         log_error("Error retrieving performance data", e, {"request_id": request_id})
@@ -759,7 +748,7 @@ async def get_performance_data(
         500: {"description": "Internal server error"},
     },
 )
-async def get_saturation_runs(
+def get_saturation_runs(
     request: Request,
     hostname: Optional[str] = Query(
         None,
@@ -778,7 +767,7 @@ async def get_saturation_runs(
         description="Number of runs to skip",
     ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     List all saturation test runs.
@@ -857,7 +846,7 @@ async def get_saturation_runs(
         500: {"description": "Internal server error"},
     },
 )
-async def get_saturation_data(
+def get_saturation_data(
     request: Request,
     run_uuid: str = Query(
         ...,
@@ -872,7 +861,7 @@ async def get_saturation_data(
         example=100.0,
     ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Get detailed saturation test data for a specific run.
@@ -1185,7 +1174,7 @@ async def delete_saturation_runs_by_uuid(
         500: {"description": "Internal server error"},
     },
 )
-async def get_test_runs_grouped_by_uuid(
+def get_test_runs_grouped_by_uuid(
     request: Request,
     group_by: str = Query(
         ...,
@@ -1193,7 +1182,7 @@ async def get_test_runs_grouped_by_uuid(
         example="config_uuid",
     ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Retrieve test runs grouped by UUID with statistics.
@@ -1350,7 +1339,7 @@ async def get_test_runs_grouped_by_uuid(
         500: {"description": "Internal server error"},
     },
 )
-async def get_test_run(
+def get_test_run(
     request: Request,
     test_run_id: int = Path(
         ...,
@@ -1359,7 +1348,7 @@ async def get_test_run(
         gt=0,
     ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Retrieve complete information for a single test run.
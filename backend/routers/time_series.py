@@ -3,18 +3,155 @@ Time series API router
 """
 
 import sqlite3
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
+import orjson
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
+from api_models import HistoricalDataResponse
 from auth.middleware import User, require_admin
-from database.connection import get_db
+from database.connection import get_db, get_db_ro
 from database.models import TrendData
 from utils.logging import log_error, log_info
 
 router = APIRouter()
 
+# /history response fields and their position in the history SELECT
+HISTORY_FIELDS = (
+    ("test_run_id", 0),
+    ("timestamp", 1),
+    ("hostname", 2),
+    ("protocol", 3),
+    ("drive_model", 4),
+    ("block_size", 6),
+    ("read_write_pattern", 7),
+    ("queue_depth", 8),
+    ("avg_latency", 10),
+    ("bandwidth", 11),
+    ("iops", 9),
+    ("p70_latency", 12),
+    ("p90_latency", 13),
+    ("p95_latency", 14),
+    ("p99_latency", 15),
+    ("config_uuid", 16),
+    ("run_uuid", 17),
+)
+HISTORY_FIELD_INDEX = dict(HISTORY_FIELDS)
+
+# Rows encoded per streamed chunk
+STREAM_BATCH_SIZE = 512
+
+
+def _iter_row_batches(rows: list) -> Iterator[list]:
+    """Yield the fetched rows in STREAM_BATCH_SIZE slices
+
+    The streaming endpoints fetch all rows before returning their StreamingResponse and only
+    encode lazily. Their connection comes from the get_db_ro yield dependency, whose teardown
+    runs before the body is sent from FastAPI 0.106 on, so a cursor must not outlive the
+    handler. Fetching up front also turns database errors into a 500 rather than a truncated
+    200 body.
+    """
+    for start in range(0, len(rows), STREAM_BATCH_SIZE):
+        yield rows[start : start + STREAM_BATCH_SIZE]
+
+
+def _stream_history_rows(rows: list, metric_type: Optional[str], total_count: int, limit: int, offset: int, log_context: dict) -> Iterator[bytes]:
+    """Encode fetched /history rows batch by batch; pagination follows the data"""
+    metric_index = HISTORY_FIELD_INDEX.get(metric_type) if metric_type else None
+    returned_count = 0
+
+    yield b'{"data":['
+    for batch in _iter_row_batches(rows):
+        # If metric_type is specified, only include records with that metric value
+        if metric_type:
+            batch = [row for row in batch if metric_index is not None and row[metric_index] is not None]
+        if not batch:
+            continue
+
+        chunk = b",".join(orjson.dumps({field: row[index] for field, index in HISTORY_FIELDS}) for row in batch)
+        yield (b"," + chunk) if returned_count else chunk
+        returned_count += len(batch)
+
+    has_more = returned_count == limit and (offset + returned_count) < total_count
+    pagination = {
+        "total_count": total_count,
+        "limit": limit,
+        "offset": offset,
+        "returned_count": returned_count,
+        "has_more": has_more,
+    }
+    yield b'],"pagination":' + orjson.dumps(pagination) + b"}"
+
+    log_info(
+        "Historical time series data retrieved successfully",
+        {**log_context, "results_count": returned_count, "has_more": has_more},
+    )
+
+
+def _stream_trends(rows: list, metric: str, log_context: dict) -> Iterator[bytes]:
+    """Encode fetched trend points batch by batch; the analysis follows the data"""
+    unit = get_metric_unit(metric)
+    window = deque(maxlen=3)
+    prev_value = None
+    first_value = None
+    min_value = max_value = None
+    total = 0.0
+    count = 0
+
+    yield b'{"data":['
+    for batch in _iter_row_batches(rows):
+        trends = []
+        for timestamp, block_size, pattern, queue_depth, value in batch:
+            # Calculate percentage change
+            percent_change = None
+            if prev_value is not None and prev_value != 0:
+                percent_change = f"{((value - prev_value) / prev_value) * 100:.2f}%"
+
+            # Calculate moving average (3-point)
+            window.append(value)
+            moving_avg = sum(window) / len(window) if len(window) == 3 else None
+
+            trends.append(
+                TrendData(
+                    timestamp=timestamp,
+                    block_size=block_size,
+                    read_write_pattern=pattern,
+                    queue_depth=queue_depth,
+                    value=value,
+                    unit=unit,
+                    moving_avg=moving_avg,
+                    percent_change=percent_change,
+                )
+            )
+
+            if first_value is None:
+                first_value = min_value = max_value = value
+            min_value = min(min_value, value)
+            max_value = max(max_value, value)
+            total += value
+            prev_value = value
+
+        chunk = b",".join(orjson.dumps(trend) for trend in trends)
+        yield (b"," + chunk) if count else chunk
+        count += len(trends)
+
+    # Calculate trend analysis
+    trend_analysis = {
+        "total_points": count,
+        "min_value": min_value,
+        "max_value": max_value,
+        "avg_value": total / count,
+        "first_value": first_value,
+        "last_value": prev_value,
+        "overall_change": (f"{((prev_value - first_value) / first_value) * 100:.2f}%" if first_value != 0 else "N/A"),
+    }
+    yield b'],"trend_analysis":' + orjson.dumps(trend_analysis) + b"}"
+
+    log_info("Trend analysis completed successfully", {**log_context, "data_points": count})
+
 
 @router.get(
     "/servers",
@@ -53,10 +190,10 @@ router = APIRouter()
     },
 )
 @router.get("/servers/", include_in_schema=False)  # Handle with trailing slash but hide from docs
-async def get_servers(
+def get_servers(
     request: Request,
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Retrieve list of servers with aggregated test run statistics.
@@ -173,7 +310,7 @@ async def get_servers(
     },
 )
 @router.get("/all/", include_in_schema=False)  # Handle with trailing slash but hide from docs
-async def get_all_time_series(
+def get_all_time_series(
     request: Request,
     hostnames: Optional[str] = Query(
         None,
@@ -244,7 +381,7 @@ async def get_all_time_series(
     ),
     offset: int = Query(0, ge=0, description="Number of records to skip for pagination", example=0),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Retrieve complete historical time series data with advanced filtering.
@@ -319,25 +456,25 @@ async def get_all_time_series(
             params.extend(block_size_list)
 
         if syncs:
-            sync_list = [int(s.strip()) for s in syncs.split(",")]
+            sync_list = list(map(int, syncs.split(",")))
             placeholders = ",".join(["?" for _ in sync_list])
             where_conditions.append(f"sync IN ({placeholders})")
             params.extend(sync_list)
 
         if queue_depths:
-            queue_depth_list = [int(q.strip()) for q in queue_depths.split(",")]
+            queue_depth_list = list(map(int, queue_depths.split(",")))
             placeholders = ",".join(["?" for _ in queue_depth_list])
             where_conditions.append(f"queue_depth IN ({placeholders})")
             params.extend(queue_depth_list)
 
         if directs:
-            direct_list = [int(d.strip()) for d in directs.split(",")]
+            direct_list = list(map(int, directs.split(",")))
             placeholders = ",".join(["?" for _ in direct_list])
             where_conditions.append(f"direct IN ({placeholders})")
             params.extend(direct_list)
 
         if num_jobs:
-            num_jobs_list = [int(n.strip()) for n in num_jobs.split(",")]
+            num_jobs_list = list(map(int, num_jobs.split(",")))
             placeholders = ",".join(["?" for _ in num_jobs_list])
             where_conditions.append(f"num_jobs IN ({placeholders})")
             params.extend(num_jobs_list)
@@ -349,7 +486,7 @@ async def get_all_time_series(
             params.extend(test_size_list)
 
         if durations:
-            duration_list = [int(d.strip()) for d in durations.split(",")]
+            duration_list = list(map(int, durations.split(",")))
             placeholders = ",".join(["?" for _ in duration_list])
             where_conditions.append(f"duration IN ({placeholders})")
             params.extend(duration_list)
@@ -373,10 +510,11 @@ async def get_all_time_series(
             params + [limit, offset],
         )
 
-        # Convert to dictionaries
+        # Convert to dictionaries (zipping one column tuple is ~3x faster than dict(sqlite3.Row))
+        columns = tuple(description[0] for description in cursor.description)
         results = []
         for row in cursor.fetchall():
-            test_run_data = dict(row)
+            test_run_data = dict(zip(columns, row))
             test_run_data["block_size"] = str(test_run_data["block_size"])  # Ensure string
             results.append(test_run_data)
 
@@ -402,7 +540,7 @@ async def get_all_time_series(
             },
         )
 
-        return results
+        return ORJSONResponse(results)
 
     except Exception as e:
         log_error("Error retrieving all time series data", e, {"request_id": request_id})
@@ -456,7 +594,7 @@ async def get_all_time_series(
     },
 )
 @router.get("/latest/", include_in_schema=False)  # Handle with trailing slash but hide from docs
-async def get_latest_time_series(
+def get_latest_time_series(
     request: Request,
     hostnames: Optional[str] = Query(
         None,
@@ -471,7 +609,7 @@ async def get_latest_time_series(
         example=50,
     ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Retrieve latest test data formatted for time series visualization.
@@ -581,7 +719,7 @@ async def get_latest_time_series(
         )
 
         # Frontend expects direct array, not wrapped object
-        return results
+        return ORJSONResponse(results)
 
     except Exception as e:
         log_error("Error retrieving latest time series data", e, {"request_id": request_id})
@@ -595,28 +733,40 @@ async def get_latest_time_series(
     response_description="Historical time series data matching the specified criteria",
     responses={
         200: {
+            "model": HistoricalDataResponse,
             "description": "Historical time series data retrieved successfully",
             "content": {
                 "application/json": {
-                    "example": [
-                        {
-                            "test_run_id": 1,
-                            "timestamp": "2025-06-31T20:00:00",
-                            "hostname": "server-01",
-                            "protocol": "Local",
-                            "drive_model": "Samsung SSD 980 PRO",
-                            "block_size": "4K",
-                            "read_write_pattern": "randread",
-                            "queue_depth": 32,
-                            "iops": 125000.5,
-                            "avg_latency": 0.256,
-                            "bandwidth": 488.28,
-                            "p70_latency": 0.384,
-                            "p90_latency": 0.448,
-                            "p95_latency": 0.512,
-                            "p99_latency": 1.024,
-                        }
-                    ]
+                    "example": {
+                        "data": [
+                            {
+                                "test_run_id": 1,
+                                "timestamp": "2025-06-31T20:00:00",
+                                "hostname": "server-01",
+                                "protocol": "Local",
+                                "drive_model": "Samsung SSD 980 PRO",
+                                "block_size": "4K",
+                                "read_write_pattern": "randread",
+                                "queue_depth": 32,
+                                "avg_latency": 0.256,
+                                "bandwidth": 488.28,
+                                "iops": 125000.5,
+                                "p70_latency": 0.384,
+                                "p90_latency": 0.448,
+                                "p95_latency": 0.512,
+                                "p99_latency": 1.024,
+                                "config_uuid": "550e8400-e29b-41d4-a716-446655440000",
+                                "run_uuid": "6ba7b810-9dad-11d1-80b4-00c04fd430c8",
+                            }
+                        ],
+                        "pagination": {
+                            "total_count": 1,
+                            "limit": 10000,
+                            "offset": 0,
+                            "returned_count": 1,
+                            "has_more": False,
+                        },
+                    }
                 }
             },
         },
@@ -626,7 +776,7 @@ async def get_latest_time_series(
     },
 )
 @router.get("/history/", include_in_schema=False)  # Handle with trailing slash but hide from docs
-async def get_historical_time_series(
+def get_historical_time_series(
     request: Request,
     hostname: Optional[str] = Query(
         None,
@@ -687,8 +837,15 @@ async def get_historical_time_series(
         example=1000,
     ),
     offset: int = Query(0, ge=0, description="Number of records to skip for pagination", example=0),
+    layout: str = Query(
+        "rows",
+        alias="format",
+        pattern="^(rows|columns)$",
+        description="Payload layout: 'rows' (list of objects) or 'columns' (one list per field)",
+        example="columns",
+    ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Retrieve historical performance data with comprehensive filtering options.
@@ -715,6 +872,11 @@ async def get_historical_time_series(
     where the specified metric has a non-null value. Useful for ensuring
     complete data for specific analysis.
 
+    **Columnar Format:**
+    With `format=columns`, `data` is an object mapping each field name to a
+    list of values (row i is the i-th entry of every list). This avoids one
+    JSON object per record on large result sets.
+
     **Use Cases:**
     - Performance trend analysis over time
     - Before/after performance comparisons
@@ -838,62 +1000,49 @@ async def get_historical_time_series(
             params + [limit, offset],
         )
 
-        results = []
-        for row in cursor.fetchall():
-            # Build the result object with all metrics (matching Node.js structure)
-            result = {
-                "test_run_id": row[0],
-                "timestamp": row[1],
-                "hostname": row[2],
-                "protocol": row[3],
-                "drive_model": row[4],
-                "block_size": row[6],
-                "read_write_pattern": row[7],
-                "queue_depth": row[8],
-                "avg_latency": row[10],
-                "bandwidth": row[11],
-                "iops": row[9],
-                "p70_latency": row[12],
-                "p90_latency": row[13],
-                "p95_latency": row[14],
-                "p99_latency": row[15],
-                "config_uuid": row[16],
-                "run_uuid": row[17],
-            }
+        log_context = {
+            "request_id": request_id,
+            "total_count": total_count,
+            "date_range": {"start": start_date, "end": end_date},
+        }
 
-            # If metric_type is specified, filter results to only include records with that metric value
-            if metric_type:
-                metric_value = result.get(metric_type)
-                if metric_value is None:
-                    continue  # Skip records without the requested metric
+        rows = cursor.fetchall()
+
+        if layout == "rows":
+            # Rows are encoded batch by batch while the response is being sent
+            return StreamingResponse(
+                _stream_history_rows(rows, metric_type, total_count, limit, offset, log_context),
+                media_type="application/json",
+            )
 
-            results.append(result)
+        # If metric_type is specified, filter results to only include records with that metric value
+        if metric_type:
+            metric_index = HISTORY_FIELD_INDEX.get(metric_type)
+            rows = [row for row in rows if metric_index is not None and row[metric_index] is not None]
+
+        columns = list(zip(*rows))
+        results = {field: list(columns[index]) if columns else [] for field, index in HISTORY_FIELDS}
+        returned_count = len(rows)
 
         # Prepare paginated response
-        has_more = len(results) == limit and (offset + len(results)) < total_count
+        has_more = returned_count == limit and (offset + returned_count) < total_count
         response = {
             "data": results,
             "pagination": {
                 "total_count": total_count,
                 "limit": limit,
                 "offset": offset,
-                "returned_count": len(results),
+                "returned_count": returned_count,
                 "has_more": has_more,
             },
         }
 
         log_info(
             "Historical time series data retrieved successfully",
-            {
-                "request_id": request_id,
-                "results_count": len(results),
-                "total_count": total_count,
-                "has_more": has_more,
-                "date_range": {"start": start_date, "end": end_date},
-            },
+            {**log_context, "results_count": returned_count, "has_more": has_more},
         )
 
-        return response
+        return ORJSONResponse(response)
 
     except Exception as e:
         log_error(
@@ -948,7 +1097,7 @@ async def get_historical_time_series(
     },
 )
 @router.get("/trends/", include_in_schema=False)  # Handle with trailing slash but hide from docs
-async def get_trends(
+def get_trends(
     request: Request,
     hostname: str = Query(
         ...,
@@ -969,7 +1118,7 @@ async def get_trends(
         example=30,
     ),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """
     Analyze performance trends for a specific host and metric over time.
@@ -1037,63 +1186,8 @@ async def get_trends(
                 "trend_analysis": {"message": "No data found for the specified period"},
             }
 
-        # Calculate trends
-        trends = []
-        prev_value = None
-
-        for i, row in enumerate(rows):
-            timestamp, block_size, pattern, queue_depth, value = row
-
-            # Calculate percentage change
-            percent_change = None
-            if prev_value is not None and prev_value != 0:
-                percent_change = f"{((value - prev_value) / prev_value) * 100:.2f}%"
-
-            # Calculate moving average (3-point)
-            moving_avg = None
-            if i >= 2:
-                window_values = [rows[j][4] for j in range(i - 2, i + 1)]
-                moving_avg = sum(window_values) / len(window_values)
-
-            trends.append(
-                TrendData(
-                    timestamp=timestamp,
-                    block_size=block_size,
-                    read_write_pattern=pattern,
-                    queue_depth=queue_depth,
-                    value=value,
-                    unit=get_metric_unit(metric),
-                    moving_avg=moving_avg,
-                    percent_change=percent_change,
-                )
-            )
-
-            prev_value = value
-
-        # Calculate trend analysis
-        values = [row[4] for row in rows]
-        trend_analysis = {
-            "total_points": len(values),
-            "min_value": min(values),
-            "max_value": max(values),
-            "avg_value": sum(values) / len(values),
-            "first_value": values[0],
-            "last_value": values[-1],
-            "overall_change": (f"{((values[-1] - values[0]) / values[0]) * 100:.2f}%" if values[0] != 0 else "N/A"),
-        }
-
-        log_info(
-            "Trend analysis completed successfully",
-            {
-                "request_id": request_id,
-                "hostname": hostname,
-                "metric": metric,
-                "days": days,
-                "data_points": len(trends),
-            },
-        )
-
-        return {"data": trends, "trend_analysis": trend_analysis}
+        log_context = {"request_id": request_id, "hostname": hostname, "metric": metric, "days": days}
+        return StreamingResponse(_stream_trends(rows, metric, log_context), media_type="application/json")
 
     except Exception as e:
         log_error("Error retrieving trend analysis", e, {"request_id": request_id})
@@ -1422,14 +1516,14 @@ async def delete_time_series(
     summary="Preview Historical Data Cleanup",
     description="Preview how many records will be affected by a cleanup operation",
 )
-async def preview_history_cleanup(
+def preview_history_cleanup(
     request: Request,
     cutoff_date: str = Query(..., description="Cutoff date in YYYY-MM-DD format"),
     mode: str = Query(..., description="Cleanup mode: 'delete-old' or 'compact'"),
     frequency: Optional[str] = Query(None, description="For compact mode: 'daily', 'weekly', or 'monthly'"),
     hostname: Optional[str] = Query(None, description="Optional hostname filter"),
     user: User = Depends(require_admin),
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_db_ro),
 ):
     """Preview the number of records that will be affected by cleanup operation."""
     request_id = getattr(request.state, "request_id", "unknown")
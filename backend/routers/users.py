@@ -9,7 +9,7 @@ import bcrypt
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
-from auth.authentication import parse_htpasswd
+from auth.authentication import invalidate_htpasswd_cache, parse_htpasswd
 from auth.middleware import require_admin, require_auth
 from config.settings import settings
 from utils.logging import log_error, log_info
@@ -75,6 +75,9 @@ def write_users_to_file(users: dict, file_path: Path):
     except Exception as e:
         log_error(f"Failed to write users to {file_path}", e)
         raise HTTPException(status_code=500, detail="Failed to save user data")
+    finally:
+        # Old hashes must stop working even if the rewrite left the file's stat unchanged
+        invalidate_htpasswd_cache()
 
 
 def validate_user_operation(username: str, current_username: str, operation: str):
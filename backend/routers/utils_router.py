@@ -2,9 +2,13 @@
 Utils API router
 """
 
+import hashlib
 import sqlite3
+from functools import lru_cache
+from typing import Dict, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 # Removed FilterOptions import - using plain dictionary
 from auth.middleware import User, require_admin
@@ -14,6 +18,54 @@ from utils.logging import log_error, log_info
 
 router = APIRouter()
 
+# Filter name and the expression it lists (matching Node.js response order)
+FILTER_COLUMNS = (
+    ("drive_models", "drive_model"),
+    ("host_disk_combinations", "hostname || ' - ' || protocol || ' - ' || drive_model"),
+    ("block_sizes", "block_size"),
+    ("patterns", "read_write_pattern"),
+    ("syncs", "sync"),
+    ("queue_depths", "queue_depth"),
+    ("directs", "direct"),
+    ("num_jobs", "num_jobs"),
+    ("test_sizes", "test_size"),
+    ("durations", "duration"),
+    ("hostnames", "hostname"),
+    ("protocols", "protocol"),
+    ("drive_types", "drive_type"),
+)
+
+# All distinct values in one statement; the concatenation is NULL whenever one of its parts is
+FILTER_OPTIONS_SQL = (
+    " UNION ALL ".join(
+        f"SELECT DISTINCT '{filter_name}' AS filter_name, {expression} AS value "
+        f"FROM test_runs WHERE {expression} IS NOT NULL"
+        for filter_name, expression in FILTER_COLUMNS
+    )
+    + " ORDER BY filter_name, value"
+)
+
+
+def _data_version(db: sqlite3.Connection) -> Tuple[int, int]:
+    """Cheap token that changes whenever the database content changes"""
+    # total_changes covers writes on the shared connection, data_version commits from other connections
+    return db.total_changes, db.execute("PRAGMA data_version").fetchone()[0]
+
+
+@lru_cache(maxsize=1)
+def _load_filter_options(db: sqlite3.Connection, version: Tuple[int, int]) -> Tuple[Dict[str, Tuple], bytes, str]:
+    """Collect the distinct filter values in one query; cached until the data version changes
+
+    Returns the options together with their encoded JSON body and an ETag derived from that body,
+    so the tag is the same across worker processes and restarts as long as the data is.
+    """
+    options = {filter_name: [] for filter_name, _ in FILTER_COLUMNS}
+    for filter_name, value in db.execute(FILTER_OPTIONS_SQL):
+        options[filter_name].append(value)
+    filters = {filter_name: tuple(values) for filter_name, values in options.items()}
+    body = orjson.dumps(filters)
+    return filters, body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
 
 @router.get(
     "/filters",
@@ -100,71 +152,11 @@ async def get_filters(
     request_id = getattr(request.state, "request_id", "unknown")
 
     try:
-        cursor = db.cursor()
-        filters = {}
-
-        # Get distinct values for each filter (matching Node.js response order)
-        filter_queries = [
-            (
-                "drive_models",
-                "SELECT DISTINCT drive_model FROM test_runs WHERE drive_model IS NOT NULL ORDER BY drive_model",
-            ),
-            (
-                "host_disk_combinations",
-                "SELECT DISTINCT (hostname || ' - ' || protocol || ' - ' || drive_model) as host_disk_combo "
-                "FROM test_runs WHERE hostname IS NOT NULL AND protocol IS NOT NULL AND drive_model IS NOT NULL "
-                "ORDER BY host_disk_combo",
-            ),
-            (
-                "block_sizes",
-                "SELECT DISTINCT block_size FROM test_runs WHERE block_size IS NOT NULL ORDER BY block_size",
-            ),
-            (
-                "patterns",
-                "SELECT DISTINCT read_write_pattern FROM test_runs WHERE read_write_pattern IS NOT NULL ORDER BY read_write_pattern",
-            ),
-            (
-                "syncs",
-                "SELECT DISTINCT sync FROM test_runs WHERE sync IS NOT NULL ORDER BY sync",
-            ),
-            (
-                "queue_depths",
-                "SELECT DISTINCT queue_depth FROM test_runs WHERE queue_depth IS NOT NULL ORDER BY queue_depth",
-            ),
-            (
-                "directs",
-                "SELECT DISTINCT direct FROM test_runs WHERE direct IS NOT NULL ORDER BY direct",
-            ),
-            (
-                "num_jobs",
-                "SELECT DISTINCT num_jobs FROM test_runs WHERE num_jobs IS NOT NULL ORDER BY num_jobs",
-            ),
-            (
-                "test_sizes",
-                "SELECT DISTINCT test_size FROM test_runs WHERE test_size IS NOT NULL ORDER BY test_size",
-            ),
-            (
-                "durations",
-                "SELECT DISTINCT duration FROM test_runs WHERE duration IS NOT NULL ORDER BY duration",
-            ),
-            (
-                "hostnames",
-                "SELECT DISTINCT hostname FROM test_runs WHERE hostname IS NOT NULL ORDER BY hostname",
-            ),
-            (
-                "protocols",
-                "SELECT DISTINCT protocol FROM test_runs WHERE protocol IS NOT NULL ORDER BY protocol",
-            ),
-            (
-                "drive_types",
-                "SELECT DISTINCT drive_type FROM test_runs WHERE drive_type IS NOT NULL ORDER BY drive_type",
-            ),
-        ]
-
-        for filter_name, query in filter_queries:
-            cursor.execute(query)
-            values = [row[0] for row in cursor.fetchall()]
-            filters[filter_name] = values
+        filters, body, etag = _load_filter_options(db, _data_version(db))
+        # The browser revalidates on every use and gets a bodiless 304 while the data is unchanged
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
 
         log_info(
             "Filter options retrieved successfully",
@@ -175,7 +167,7 @@ async def get_filters(
             },
         )
 
-        return filters
+        return Response(body, media_type="application/json", headers=headers)
 
     except Exception as e:
         log_error("Error retrieving filter options", e, {"request_id": request_id})
@@ -2,58 +2,91 @@
 Logging utilities
 """
 
-import json
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 
+import orjson
+
+logger = logging.getLogger(__name__)
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _with_context(message: str, context: Dict[str, Any]) -> str:
+    """Append the JSON-encoded context to a log message"""
+    return f"{message} - {orjson.dumps(context, default=str, option=_DUMPS_OPTIONS).decode()}"
+
 
 def setup_logging():
-    """Setup application logging"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler()],
-    )
+    """Setup application logging
+
+    Records are handed to a QueueHandler and written by a QueueListener thread, so
+    request handlers never block on the stream handler's lock or on stderr I/O.
+    """
+    if logging.getLogger().handlers:
+        return  # Already configured (basicConfig would be a no-op as well)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+
+    # The queue handler only merges args into the message; the listener's handler adds the prefix
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
 
 def log_info(message: str, context: Optional[Dict[str, Any]] = None):
     """Log info message with context"""
-    logger = logging.getLogger(__name__)
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
     if context:
-        logger.info(f"{message} - {json.dumps(context, default=str)}")
+        logger.info(_with_context(message, context))
     else:
         logger.info(message)
 
 
 def log_error(message: str, error: Exception, context: Optional[Dict[str, Any]] = None):
     """Log error message with context"""
-    logger = logging.getLogger(__name__)
-
     error_context = {
         "error_type": type(error).__name__,
         "error_message": str(error),
         **(context or {}),
     }
 
-    logger.error(f"{message} - {json.dumps(error_context, default=str)}")
+    logger.error(_with_context(message, error_context))
 
 
 def log_warning(message: str, context: Optional[Dict[str, Any]] = None):
     """Log warning message with context"""
-    logger = logging.getLogger(__name__)
+    if not logger.isEnabledFor(logging.WARNING):
+        return
 
     if context:
-        logger.warning(f"{message} - {json.dumps(context, default=str)}")
+        logger.warning(_with_context(message, context))
     else:
         logger.warning(message)
 
 
+def debug_enabled() -> bool:
+    """Whether debug messages would be emitted (check before building expensive context)"""
+    return logger.isEnabledFor(logging.DEBUG)
+
+
 def log_debug(message: str, context: Optional[Dict[str, Any]] = None):
     """Log debug message with context"""
-    logger = logging.getLogger(__name__)
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
 
     if context:
-        logger.debug(f"{message} - {json.dumps(context, default=str)}")
+        logger.debug(_with_context(message, context))
     else:
         logger.debug(message)